@@ -1,519 +1,848 @@
-import flet as ft
-
-def calculate_capacitance(capacitances, configuration):
-    """Calculates total capacitance based on configuration."""
-    if not capacitances:
-        return "Error: At least one capacitance value is required."
-    for c in capacitances:
-        if c <= 0:
-            return "Error: All capacitance values must be positive."
-    if configuration == "Parallel":
-        return sum(capacitances)
-    elif configuration == "Series":
-        return 1.0 / sum(1.0 / c for c in capacitances)
-    return "Error: Configuration must be 'Series' or 'Parallel'."
-
-def calculate_magnetic_field(current, distance):
-    """Calculates the magnetic field due to a straight current-carrying wire."""
-    mu_0 = 1.2566370614359173e-6  # Permeability of free space in T·m/A
-    if not isinstance(current, (int, float)) or not isinstance(distance, (int, float)):
-        return "Error: Current and distance must be numeric."
-    if distance <= 0:
-        return "Error: Distance must be positive."
-    try:
-        return (mu_0 * current) / (2 * 3.141592653589793 * distance)
-    except Exception:
-        return "Error: Invalid current or distance."
-
-def calculate_electric_force(charge1, charge2, distance):
-    """Calculates the electric force between two point charges."""
-    k = 8.99e9  # Coulomb's constant in N·m²/C²
-    if not isinstance(charge1, (int, float)) or not isinstance(charge2, (int, float)) or not isinstance(distance, (int, float)):
-        return "Error: Charges and distance must be numeric."
-    if distance <= 0:
-        return "Error: Distance must be positive."
-    try:
-        return k * abs(charge1 * charge2) / (distance ** 2)
-    except Exception:
-        return "Error: Invalid charges or distance."
-
-def calculate_electric_field(charge, distance):
-    """Calculates the electric field due to a point charge."""
-    k = 8.99e9  # Coulomb's constant in N·m²/C²
-    if not isinstance(charge, (int, float)) or not isinstance(distance, (int, float)):
-        return "Error: Charge and distance must be numeric."
-    if distance <= 0:
-        return "Error: Distance must be positive."
-    try:
-        return k * charge / (distance ** 2)
-    except Exception:
-        return "Error: Invalid charge or distance."
-
-def calculate_resistance(resistances, configuration):
-    """Calculates total resistance based on configuration."""
-    if not resistances:
-        return "Error: At least one resistance value is required."
-    for r in resistances:
-        if r <= 0:
-            return "Error: All resistance values must be positive."
-    if configuration == "Parallel":
-        return 1.0 / sum(1.0 / r for r in resistances)
-    elif configuration == "Series":
-        return sum(resistances)
-    return "Error: Configuration must be 'Series' or 'Parallel'."
-
-def main(page: ft.Page):
+from functools import lru_cache
+
+import profiling
+from calculators import calculate_electric_field, calculate_electric_force, calculate_magnetic_field
+from live import LiveCalculation
+from reduction_cache import MAX_CACHED_VALUES, cached_calculate_capacitance, cached_calculate_resistance
+
+TOLERANCE_SAMPLES = 10 ** 7
+MIN_TOLERANCE_TRIALS = 1000
+
+
+@lru_cache(maxsize=None)
+def shared_button_style():
+    """Returns the style of every button, built once and shared by all sessions of a web deployment.
+
+    Flet only reads a style when it serializes a button. The shape is given per state, as the
+    button would otherwise rewrite it that way in place.
+    """
+    import flet as ft
+    return ft.ButtonStyle(bgcolor="#849bff", color="white",
+                          shape={ft.ControlState.DEFAULT: ft.RoundedRectangleBorder(radius=20)})
+
+
+def main(page):
+    import flet as ft  # Imported here so the formulas stay importable without the GUI stack
+
     page.title = "Physics Calculator"
     page.bgcolor = "#FCFBF4"
-    page.window.maximized = True  
+    page.window.maximized = True
     page.window.resizable = True
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
     page.vertical_alignment = ft.MainAxisAlignment.CENTER
 
     title = ft.Text("Physics Calculator", color="black", size=30,)
+    button_style = shared_button_style()
 
-    # Input Fields
-    voltage_input = ft.TextField(label="Voltage (V)", width=200, color="black")
-    current_input = ft.TextField(label="Current (A)", width=200, color="black")
-    resistance_input = ft.TextField(label="Resistance (Ω)", width=200, color="black")
-    capacitances_input = ft.TextField(label="Enter capacitances (comma-separated)", width=300, color="black")
-    resistances_input = ft.TextField(label="Enter resistances (comma-separated)", width=300, color="black")
-    current_magnetic_field = ft.TextField(label="Current (A)", width=200, color="black")
-    distance_magnetic_field = ft.TextField(label="Distance (m)", width=200, color="black")
-    charge1 = ft.TextField(label="Charge 1 (C)", width=200, color="black")
-    charge2 = ft.TextField(label="Charge 2 (C)", width=200, color="black")
-    distance = ft.TextField(label="Distance (m)", width=200, color="black")
-    charge1_electric_field = ft.TextField(label="Charge (C)", width=200, color="black")
-    distance_electric_field = ft.TextField(label="Distance (m)", width=200, color="black")
-    capacitance_img = ft.Image(src="Capacitancia_paralelo.png", width=300, height=200, visible=False)
-    resistance_img = ft.Image(src="Resistencia_paralelo.png", width=300, height=200, visible=False)
-
-    # Result Texts
-    ohms_result_text = ft.Text("", size=14, color="black")
-    capacitance_result_text = ft.Text("", size=14, color="black")
-    resistance_result_text = ft.Text("", size=14, color="black")
-    electric_force_result_text = ft.Text("", size=14, color="black")
-    magnetic_field_result_text = ft.Text("", size=14, color="black")
-    electric_field_result_text = ft.Text("", size=14, color="black")
-
-    # Text Explanations
-    ohmslaw_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Ohm's Law", size=24, weight="bold"),
-            ft.Text("Ohm's Law relates voltage (V), current (I), and resistance (R) in a circuit."),
-            ft.Text("Formula: V = I x R")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
-    capacitance_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Capacitance", size=24, weight="bold"),
-            ft.Text("Capacitance is the ability to store electric charge per unit voltage."),
-            ft.Text("Formula: C = Q / V")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
-    resistance_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Resistance", size=24, weight="bold"),
-            ft.Text("Resistance measures how much a material opposes electric current."),
-            ft.Text("Formula: R = ρ x (L / A)")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
-    electric_force_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Electric Force", size=24, weight="bold"),
-            ft.Text("Electric force is the interaction between charged particles."),
-            ft.Text("Like charges repel; opposite charges attract."),
-            ft.Text("Coulomb's Law: F = k * |q1 * q2| / r²"),
-            ft.Text("Where:"),
-            ft.Text("• F is the electric force"),
-            ft.Text("• q1 and q2 are the charges"),
-            ft.Text("• r is the distance between charges"),
-            ft.Text("• k ≈ 8.99 × 10⁹ N·m²/C² (Coulomb's constant)")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
-    magneticfield_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Magnetic Field", size=24, weight="bold"),
-            ft.Text("The magnetic field describes the magnetic influence of electric currents."),
-            ft.Text("Formula (Straight Wire): B = (μ₀ × I) / (2πr)")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
-    electricfield_explanation = ft.Container(
-        content=ft.Column([
-            ft.Text("Electric Field", size=24, weight="bold"),
-            ft.Text("Electric fields show the force per unit charge in space."),
-            ft.Text("Formula (Point Charge): E = k * q / r²")
-        ]),
-        bgcolor="#849bff", visible=False, padding=10, border_radius=10
-    )
+    # With PHYSICS_CALC_PROFILE set, time spent in page.update counts as a handler's render time
+    page.update = profiling.render(page.update)
 
     # Explanation Management
     current_explanation = ft.Ref[ft.Container]()
 
-    def show_explanation(explanation_container):
-        if current_explanation.current:
+    def update_controls(*controls):
+        # page.update() with no arguments would re-diff the whole page, so skip empty updates
+        if controls:
+            page.update(*controls)
+
+    def set_explanation(explanation_container):
+        """Shows one explanation (or none) and returns the containers whose visibility changed."""
+        changed = []
+        if current_explanation.current and current_explanation.current is not explanation_container:
             current_explanation.current.visible = False
+            changed.append(current_explanation.current)
         current_explanation.current = explanation_container
-        explanation_container.visible = True
-        page.update()
+        if explanation_container and not explanation_container.visible:
+            explanation_container.visible = True
+            changed.append(explanation_container)
+        return changed
+
+    def show_explanation(explanation_container):
+        update_controls(*set_explanation(explanation_container))
 
     def hide_explanation(e=None):
-        if current_explanation.current:
-            current_explanation.current.visible = False
-            current_explanation.current = None
-        page.update()
+        update_controls(*set_explanation(None))
 
-    # Add Hide Button to Explanations
-    for exp in [ohmslaw_explanation, capacitance_explanation, resistance_explanation,
-                electric_force_explanation, magneticfield_explanation, electricfield_explanation]:
-        exp.content.controls.append(
+    def add_hide_button(explanation_container):
+        explanation_container.content.controls.append(
             ft.ElevatedButton(
                 "Hide",
                 on_click=hide_explanation,
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
+                style=button_style
             )
         )
-
-    # Dropdown for Configurations
-    configuration_dropdown = ft.Dropdown(
-        label="Configuration",
-        options=[ft.dropdown.Option("Series"), ft.dropdown.Option("Parallel")],
-        value="Parallel",
-        width=200,
-        color="black",
-        on_change=lambda _: change_capacitance_img()
-    )
-    configuration_dropdown_r = ft.Dropdown(
-        label="Configuration",
-        options=[ft.dropdown.Option("Series"), ft.dropdown.Option("Parallel")],
-        value="Parallel",
-        width=200,
-        color="black",
-        on_change=lambda _: change_resistance_img()
-    )
-
-    def change_capacitance_img():
-        capacitance_img.src = "Capacitancia_paralelo.png" if configuration_dropdown.value == "Parallel" else "Capacitancia_serie.png"
-        capacitance_img.visible = True
-        page.update()
-
-    def change_resistance_img():
-        resistance_img.src = "Resistencia_paralelo.png" if configuration_dropdown_r.value == "Parallel" else "Resistencia_serie.png"
-        resistance_img.visible = True
-        page.update()
-
-    # Calculation Functions
-    def calculate_ohms_law(e):
-        try:
-            v, i, r = voltage_input.value, current_input.value, resistance_input.value
-            filled_count = sum(1 for x in [v, i, r] if x)
-            if filled_count != 2:
-                ohms_result_text.value = "Enter exactly 2 values"
-            else:
-                v = float(v) if v else None
-                i = float(i) if i else None
-                r = float(r) if r else None
-                if r and i:
-                    voltage_input.value = f"{i * r:.2f}"
-                    ohms_result_text.value = f"Voltage = {i * r:.2f} V"
-                elif v and i:
-                    resistance_input.value = f"{v / i:.2f}"
-                    ohms_result_text.value = f"Resistance = {v / i:.2f} Ω"
-                elif v and r:
-                    current_input.value = f"{v / r:.2f}"
-                    ohms_result_text.value = f"Current = {v / r:.2f} A"
-        except ZeroDivisionError:
-            ohms_result_text.value = "Error: Cannot divide by zero"
-        except ValueError:
-            ohms_result_text.value = "Error: Invalid input"
-        page.update()
-    def on_calculate_capacitance(e):
-        try:
-            capacitances = [float(c.strip()) for c in capacitances_input.value.split(",")]
-            result = calculate_capacitance(capacitances, configuration_dropdown.value)
-            capacitance_result_text.value = f"Total Capacitance: {result:.2f} F" if isinstance(result, float) else result
-        except ValueError:
-            capacitance_result_text.value = "Error: Invalid input. Please enter numeric valuesaccident."
-        page.update()
-
-    def on_calculate_resistance(e):
-        try:
-            resistances = [float(r.strip()) for r in resistances_input.value.split(",")]
-            result = calculate_resistance(resistances, configuration_dropdown_r.value)
-            resistance_result_text.value = f"Total Resistance: {result:.2f} Ω" if isinstance(result, float) else result
-        except ValueError:
-            resistance_result_text.value = "Error: Invalid input. Please enter numeric values."
-        page.update()
-
-    def on_calculate_electric_force(e):
-        try:
-            q1 = float(charge1.value)
-            q2 = float(charge2.value)
-            d = float(distance.value)
-            result = calculate_electric_force(q1, q2, d)
-            electric_force_result_text.value = f"Electric Force: {result:.2e} N" if isinstance(result, float) else result
-        except ValueError:
-            electric_force_result_text.value = "Error: Invalid input. Please enter numeric values."
-        page.update()
-
-    def on_calculate_magnetic_field(e):
-        try:
-            i = float(current_magnetic_field.value)
-            d = float(distance_magnetic_field.value)
-            result = calculate_magnetic_field(i, d)
-            magnetic_field_result_text.value = f"Magnetic Field: {result:.2e} T" if isinstance(result, float) else result
-        except ValueError:
-            magnetic_field_result_text.value = "Error: Invalid input. Please enter numeric values."
-        page.update()
-
-    def on_calculate_electric_field(e):
-        try:
-            q = float(charge1_electric_field.value)
-            d = float(distance_electric_field.value)
-            result = calculate_electric_field(q, d)
-            electric_field_result_text.value = f"Electric Field: {result:.2e} N/C" if isinstance(result, float) else result
-        except ValueError:
-            electric_field_result_text.value = "Error: Invalid input. Please enter numeric values."
-        page.update()
-
-    # Buttons
-    ohms_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=calculate_ohms_law,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-    capacitance_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=on_calculate_capacitance,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-    resistance_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=on_calculate_resistance,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-    electric_force_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=on_calculate_electric_force,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-    magneticfield_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=on_calculate_magnetic_field,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-    electricfield_calculate_button = ft.ElevatedButton(
-        "Calculate", on_click=on_calculate_electric_field,
-        style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-    )
-
-    # Pages
-    home_view = ft.Container(
-    content=ft.Column([
-        title,
-        ft.ResponsiveRow([
-            ft.Column([
-                ft.ElevatedButton(
-                    "Ohm's Law", on_click=lambda e: show_page(ohms_law_page, ohmslaw_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-                ),
-                ft.ElevatedButton(
-                    "Capacitance", on_click=lambda e: show_page(capacitance_page, capacitance_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-                ),
-                ft.ElevatedButton(
-                    "Resistance", on_click=lambda e: show_page(resistance_page, resistance_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-                ),
-            ], spacing=20, alignment=ft.MainAxisAlignment.CENTER, col={"sm": 6, "md": 6, "lg": 6}),
-            ft.Column([
-                ft.ElevatedButton(
-                    "Electric Force", on_click=lambda e: show_page(electric_force_page, electric_force_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-                ),
+        return explanation_container
+
+    def calculator_page(heading, controls, explanation_container):
+        """Wraps a calculator's controls with its explanation and the Back button."""
+        container = ft.Container(
+            content=ft.Column([
+                ft.Text(heading, size=20, color="black"),
+                *controls,
                 ft.ElevatedButton(
-                    "Magnetic Field", on_click=lambda e: show_page(magneticfield_page, magneticfield_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
+                    "Show Explanation", on_click=lambda e: show_explanation(explanation_container),
+                    style=button_style
                 ),
+                explanation_container,
                 ft.ElevatedButton(
-                    "Electric Field", on_click=lambda e: show_page(electricfield_page, electricfield_explanation),
-                    width=400, height=120, style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-                ),
-            ], spacing=20, alignment=ft.MainAxisAlignment.CENTER, col={"sm": 6, "md": 6, "lg": 6}),
-        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20),
-    ], alignment=ft.MainAxisAlignment.CENTER, spacing=30),
-    bgcolor="#FCFBF4",
-    width=page.window.width,
-    height=page.window.height,
-    visible=True,
-    alignment=ft.alignment.center,
-    padding=ft.padding.symmetric(vertical=50, horizontal=20)
-)
+                    "Back", on_click=lambda e: show_page("home"),
+                    style=button_style
+                )
+            ], alignment=ft.alignment.center),
+            bgcolor="#FCFBF4",
+            width=page.window.width,
+            height=page.window.height,
+            visible=False,
+            alignment=ft.alignment.center
+        )
+        return container, explanation_container
+
+    def optional_panel(label, build):
+        """Returns a column holding a button that replaces itself with build()'s controls when clicked.
+
+        The sweep, tolerance and standard-parts panels are built on request, so a session
+        only holds the controls it uses.
+        """
+        column = ft.Column(horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+
+        def on_open(e):
+            column.controls = build()
+            page.update(column)
+
+        column.controls = [ft.TextButton(label, on_click=on_open)]
+        return column
+
+    # Live calculations run timers and a worker thread, which are stopped when the session closes
+    live_calculations = []
+
+    def on_session_close(e):
+        for live in live_calculations:
+            live.close()
+
+    page.on_close = on_session_close
+
+    # One file picker, shared by the pages that accept a list of values
+    file_picker = ft.FilePicker()
+    page.overlay.append(file_picker)
+
+    def values_loader(values_input, result_text, on_loaded):
+        """Returns a Load from file button for values_input and a function returning the values to use.
+
+        Typed values take precedence; a loaded file is used while the field is empty.
+        The values are returned as a NumPy array.
+        on_loaded() is called after a file has been loaded.
+        """
+        loaded = []
+
+        def on_file_picked(e):
+            if not e.files:
+                return
+            from value_parser import load_values
+            path = e.files[0].path
+            try:
+                if path is None:
+                    raise OSError("File import needs the desktop app")
+                values = load_values(path)
+            except (OSError, ValueError):
+                result_text.value = f"Error: Could not read values from {e.files[0].name}."
+                page.update(result_text)
+                return
+            loaded[:] = [values]
+            values_input.value = ""
+            values_input.hint_text = f"{len(values)} values from {e.files[0].name}"
+            result_text.value = ""
+            page.update(values_input, result_text)
+            on_loaded()
+
+        def pick_file(e):
+            file_picker.on_result = on_file_picked
+            file_picker.pick_files(allowed_extensions=["txt", "csv", "npy"])
+
+        def read_values(text):
+            from value_parser import parse_values  # NumPy is imported on the first calculation, not at startup
+            if not text and loaded:
+                return loaded[0]
+            return parse_values(text or "")
+
+        button = ft.ElevatedButton(
+            "Load from file", on_click=pick_file,
+            style=button_style
+        )
+        return button, read_values
+
+    def sweep_panel(calculator, read_arguments, y_label):
+        """Returns controls that sweep the distance for one calculator and chart the result.
+
+        read_arguments() returns the page's other inputs, raising ValueError if they are not numeric.
+        """
+        start_input = ft.TextField(label="From (m)", value="0.01", width=120, color="black")
+        stop_input = ft.TextField(label="To (m)", value="1", width=120, color="black")
+        points_input = ft.TextField(label="Points", value="10000", width=120, color="black")
+        scale_dropdown = ft.Dropdown(
+            label="Scale",
+            options=[ft.dropdown.Option("Linear"), ft.dropdown.Option("Log")],
+            value="Linear",
+            width=120,
+            color="black"
+        )
+        sweep_result_text = ft.Text("", size=14, color="black")
+        chart = ft.LineChart(
+            data_series=[ft.LineChartData(data_points=[], stroke_width=2, color="#849bff")],
+            left_axis=ft.ChartAxis(title=ft.Text(y_label, color="black"), labels_size=60),
+            bottom_axis=ft.ChartAxis(title=ft.Text("Distance (m)", color="black"), labels_size=30),
+            width=500,
+            height=300,
+            visible=False
+        )
 
-    ohms_law_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Ohm's Law Calculation", size=20, color="black"),
+        @profiling.handler("on_sweep")
+        def on_sweep(e):
+            import numpy as np
+            from sweep import downsample, sweep
+            try:
+                arguments = read_arguments()
+                start, stop = float(start_input.value), float(stop_input.value)
+                points = int(points_input.value)
+            except ValueError:
+                sweep_result_text.value = "Error: Invalid input. Please enter numeric values."
+                page.update(sweep_result_text)
+                return
+            log = scale_dropdown.value == "Log"
+            try:
+                x, y = sweep(calculator, arguments, start, stop, points, "log" if log else "linear")
+            except ValueError as error:
+                sweep_result_text.value = f"Error: {error}."
+                page.update(sweep_result_text)
+                return
+            if log:
+                # Inverse-square and inverse laws are straight lines on log-log axes
+                with np.errstate(divide="ignore"):
+                    x, y = np.log10(x), np.log10(np.abs(y))
+            x, y = downsample(x, y)
+            chart.data_series[0].data_points = [ft.LineChartDataPoint(a, b) for a, b in zip(x.tolist(), y.tolist())]
+            chart.left_axis.title.value = f"log10 |{y_label}|" if log else y_label
+            chart.bottom_axis.title.value = "log10 Distance (m)" if log else "Distance (m)"
+            chart.visible = True
+            sweep_result_text.value = f"{points} points swept, {len(x)} plotted"
+            page.update(chart, sweep_result_text)
+
+        sweep_button = ft.ElevatedButton(
+            "Sweep", on_click=on_sweep,
+            style=button_style
+        )
+        return [
+            ft.Row([start_input, stop_input, points_input, scale_dropdown], alignment=ft.MainAxisAlignment.CENTER),
+            sweep_button,
+            sweep_result_text,
+            chart,
+        ]
+
+    def tolerance_panel(analysis, read_values, values_input, configuration_dropdown, unit):
+        """Returns controls that run a Monte Carlo tolerance analysis and chart its histogram.
+
+        analysis names the function in the tolerance module, which is imported on first use.
+        """
+        tolerance_dropdown = ft.Dropdown(
+            label="Tolerance",
+            options=[ft.dropdown.Option("±1%"), ft.dropdown.Option("±5%"), ft.dropdown.Option("±10%")],
+            value="±5%",
+            width=120,
+            color="black"
+        )
+        tolerance_result_text = ft.Text("", size=14, color="black")
+        histogram = ft.BarChart(bar_groups=[], width=500, height=200, visible=False)
+
+        @profiling.handler("on_analyze")
+        def on_analyze(e):
+            import tolerance
+            try:
+                values = read_values(values_input.value)
+            except ValueError:
+                tolerance_result_text.value = "Error: Invalid input. Please enter numeric values."
+                page.update(tolerance_result_text)
+                return
+            # Keep the UI analysis to at most TOLERANCE_SAMPLES sampled part values
+            trials = min(10 ** 6, TOLERANCE_SAMPLES // max(values.size, 1))
+            if trials < MIN_TOLERANCE_TRIALS:
+                tolerance_result_text.value = (f"Error: Tolerance analysis is limited to "
+                                               f"{TOLERANCE_SAMPLES // MIN_TOLERANCE_TRIALS} values here.")
+                page.update(tolerance_result_text)
+                return
+            result = getattr(tolerance, analysis)(values, configuration_dropdown.value,
+                                                  float(tolerance_dropdown.value.strip("±%")) / 100, trials)
+            if isinstance(result, str):
+                tolerance_result_text.value = result
+                page.update(tolerance_result_text)
+                return
+            tolerance_result_text.value = (
+                f"{result.count} trials: mean {result.mean:.4g} {unit}, std {result.std:.3g} {unit}, "
+                f"5%-95% {result.percentile(5):.4g} to {result.percentile(95):.4g} {unit}, "
+                f"min {result.min:.4g}, max {result.max:.4g}"
+            )
+            counts, edges = result.histogram(32)
+            histogram.bar_groups = [
+                ft.BarChartGroup(x=i, bar_rods=[ft.BarChartRod(to_y=int(c), width=10, color="#849bff",
+                                                               tooltip=f"{edges[i]:.4g}-{edges[i + 1]:.4g} {unit}")])
+                for i, c in enumerate(counts.tolist())
+            ]
+            histogram.visible = True
+            page.update(tolerance_result_text, histogram)
+
+        analyze_button = ft.ElevatedButton(
+            "Tolerance analysis", on_click=on_analyze,
+            style=button_style
+        )
+        return [
+            ft.Row([tolerance_dropdown, analyze_button], alignment=ft.MainAxisAlignment.CENTER),
+            tolerance_result_text,
+            histogram,
+        ]
+
+    def standard_parts_panel(kind, unit):
+        """Returns controls that find E-series parts whose series/parallel total is closest to a target."""
+        target_input = ft.TextField(label=f"Target ({unit})", hint_text="e.g. 3.3k", width=150, color="black")
+        series_dropdown = ft.Dropdown(
+            label="Series",
+            options=[ft.dropdown.Option("E12"), ft.dropdown.Option("E24"), ft.dropdown.Option("E96")],
+            value="E24",
+            width=100,
+            color="black"
+        )
+        parts_dropdown = ft.Dropdown(
+            label="Max parts",
+            options=[ft.dropdown.Option(str(n)) for n in range(1, 5)],
+            value="4",
+            width=100,
+            color="black"
+        )
+        standard_parts_text = ft.Text("", size=14, color="black")
+
+        @profiling.handler("on_find")
+        def on_find(e):
+            from eseries import describe, search
+            from value_parser import parse_values
+            try:
+                targets = parse_values(target_input.value or "")
+                if targets.size != 1:
+                    raise ValueError
+            except ValueError:
+                standard_parts_text.value = "Error: Invalid input. Please enter one numeric value."
+                page.update(standard_parts_text)
+                return
+            matches = search(float(targets[0]), kind, series_dropdown.value, int(parts_dropdown.value))
+            if isinstance(matches, str):
+                standard_parts_text.value = matches
+            else:
+                standard_parts_text.value = "\n".join(
+                    f"{m['parts']} part{'s' if m['parts'] > 1 else ''}: {describe(m['network'], unit)}"
+                    f" = {m['value']:.4g} {unit} (error {m['error']:.3%})"
+                    for m in matches
+                )
+            page.update(standard_parts_text)
+
+        find_button = ft.ElevatedButton(
+            "Find standard parts", on_click=on_find,
+            style=button_style
+        )
+        return [
+            ft.Row([target_input, series_dropdown, parts_dropdown, find_button], alignment=ft.MainAxisAlignment.CENTER),
+            standard_parts_text,
+        ]
+
+    # Pages, each built the first time it is shown
+    def build_ohms_law_page():
+        voltage_input = ft.TextField(label="Voltage (V)", width=200, color="black")
+        current_input = ft.TextField(label="Current (A)", width=200, color="black")
+        resistance_input = ft.TextField(label="Resistance (Ω)", width=200, color="black")
+        ohms_result_text = ft.Text("", size=14, color="black")
+
+        @profiling.handler("calculate_ohms_law")
+        def calculate_ohms_law(e):
+            changed = [ohms_result_text]
+            try:
+                v, i, r = voltage_input.value, current_input.value, resistance_input.value
+                filled_count = sum(1 for x in [v, i, r] if x)
+                if filled_count != 2:
+                    ohms_result_text.value = "Enter exactly 2 values"
+                else:
+                    v = float(v) if v else None
+                    i = float(i) if i else None
+                    r = float(r) if r else None
+                    if r and i:
+                        voltage_input.value = f"{i * r:.2f}"
+                        changed.append(voltage_input)
+                        ohms_result_text.value = f"Voltage = {i * r:.2f} V"
+                    elif v and i:
+                        resistance_input.value = f"{v / i:.2f}"
+                        changed.append(resistance_input)
+                        ohms_result_text.value = f"Resistance = {v / i:.2f} Ω"
+                    elif v and r:
+                        current_input.value = f"{v / r:.2f}"
+                        changed.append(current_input)
+                        ohms_result_text.value = f"Current = {v / r:.2f} A"
+            except ZeroDivisionError:
+                ohms_result_text.value = "Error: Cannot divide by zero"
+            except ValueError:
+                ohms_result_text.value = "Error: Invalid input"
+            page.update(*changed)
+
+        ohms_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=calculate_ohms_law,
+            style=button_style
+        )
+        ohmslaw_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Ohm's Law", size=24, weight="bold"),
+                ft.Text("Ohm's Law relates voltage (V), current (I), and resistance (R) in a circuit."),
+                ft.Text("Formula: V = I x R")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Ohm's Law Calculation", [
             voltage_input,
             current_input,
             resistance_input,
             ohms_calculate_button,
             ohms_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(ohmslaw_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            ohmslaw_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
-
-    capacitance_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Capacitance Calculation", size=20, color="black"),
+        ], ohmslaw_explanation)
+
+    def build_capacitance_page():
+        capacitances_input = ft.TextField(label="Enter capacitances (comma-separated)", hint_text="e.g. 4.7u, 10n, 100p", width=300, color="black")
+        capacitance_img = ft.Image(src="Capacitancia_paralelo.png", width=300, height=200, visible=False)
+        capacitance_result_text = ft.Text("", size=14, color="black")
+        capacitance_file_button, read_capacitances = values_loader(capacitances_input, capacitance_result_text, lambda: recalculate_live())
+
+        def change_capacitance_img():
+            capacitance_img.src = "Capacitancia_paralelo.png" if configuration_dropdown.value == "Parallel" else "Capacitancia_serie.png"
+            capacitance_img.visible = True
+            page.update(capacitance_img)
+            recalculate_live()
+
+        configuration_dropdown = ft.Dropdown(
+            label="Configuration",
+            options=[ft.dropdown.Option("Series"), ft.dropdown.Option("Parallel")],
+            value="Parallel",
+            width=200,
+            color="black",
+            on_change=lambda _: change_capacitance_img()
+        )
+
+        def capacitance_message(text, configuration):
+            """Parses and calculates; also runs on the live worker thread, so it only reads its arguments."""
+            try:
+                from eseries import format_value
+                from parallel_reduction import calculate_capacitance_parallel
+                capacitances = read_capacitances(text)
+                # Long lists skip the cache; they are summed in blocks, in worker processes once they are long enough
+                if capacitances.size > MAX_CACHED_VALUES:
+                    result = calculate_capacitance_parallel(capacitances, configuration)
+                else:
+                    result = cached_calculate_capacitance(capacitances.tolist(), configuration)
+                return f"Total Capacitance: {format_value(result)} F" if isinstance(result, float) else result
+            except ValueError:
+                return "Error: Invalid input. Please enter numeric valuesaccident."
+
+        def show_capacitance_message(message):
+            capacitance_result_text.value = message
+            page.update(capacitance_result_text)
+
+        live_capacitance = LiveCalculation(capacitance_message, show_capacitance_message)
+        live_calculations.append(live_capacitance)
+
+        def recalculate_live():
+            if live_capacitance_switch.value:
+                live_capacitance.submit(capacitances_input.value, configuration_dropdown.value)
+
+        def on_live_capacitance_change(e):
+            if live_capacitance_switch.value:
+                recalculate_live()
+            else:
+                live_capacitance.cancel()
+
+        live_capacitance_switch = ft.Switch(label="Live results", value=False, on_change=on_live_capacitance_change)
+        capacitances_input.on_change = lambda e: recalculate_live()
+
+        @profiling.handler("on_calculate_capacitance")
+        def on_calculate_capacitance(e):
+            live_capacitance.cancel()  # A pending live result is older than this one
+            show_capacitance_message(capacitance_message(capacitances_input.value, configuration_dropdown.value))
+
+        capacitance_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=on_calculate_capacitance,
+            style=button_style
+        )
+        capacitance_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Capacitance", size=24, weight="bold"),
+                ft.Text("Capacitance is the ability to store electric charge per unit voltage."),
+                ft.Text("Formula: C = Q / V")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Capacitance Calculation", [
             capacitances_input,
+            capacitance_file_button,
             configuration_dropdown,
             capacitance_img,
             capacitance_calculate_button,
+            live_capacitance_switch,
             capacitance_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(capacitance_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            capacitance_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
-
-    resistance_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Resistance Calculation", size=20, color="black"),
+            optional_panel("Tolerance analysis", lambda: tolerance_panel(
+                "analyze_capacitance_tolerance", read_capacitances, capacitances_input, configuration_dropdown, "F")),
+            optional_panel("Standard parts", lambda: standard_parts_panel("capacitance", "F")),
+        ], capacitance_explanation)
+
+    def build_resistance_page():
+        resistances_input = ft.TextField(label="Enter resistances (comma-separated)", hint_text="e.g. 4.7k, 10k, 1M", width=300, color="black")
+        resistance_img = ft.Image(src="Resistencia_paralelo.png", width=300, height=200, visible=False)
+        resistance_result_text = ft.Text("", size=14, color="black")
+        resistance_file_button, read_resistances = values_loader(resistances_input, resistance_result_text, lambda: recalculate_live())
+
+        def change_resistance_img():
+            resistance_img.src = "Resistencia_paralelo.png" if configuration_dropdown_r.value == "Parallel" else "Resistencia_serie.png"
+            resistance_img.visible = True
+            page.update(resistance_img)
+            recalculate_live()
+
+        configuration_dropdown_r = ft.Dropdown(
+            label="Configuration",
+            options=[ft.dropdown.Option("Series"), ft.dropdown.Option("Parallel")],
+            value="Parallel",
+            width=200,
+            color="black",
+            on_change=lambda _: change_resistance_img()
+        )
+
+        def resistance_message(text, configuration):
+            """Parses and calculates; also runs on the live worker thread, so it only reads its arguments."""
+            try:
+                from eseries import format_value
+                from parallel_reduction import calculate_resistance_parallel
+                resistances = read_resistances(text)
+                # Long lists skip the cache; they are summed in blocks, in worker processes once they are long enough
+                if resistances.size > MAX_CACHED_VALUES:
+                    result = calculate_resistance_parallel(resistances, configuration)
+                else:
+                    result = cached_calculate_resistance(resistances.tolist(), configuration)
+                return f"Total Resistance: {format_value(result)} Ω" if isinstance(result, float) else result
+            except ValueError:
+                return "Error: Invalid input. Please enter numeric values."
+
+        def show_resistance_message(message):
+            resistance_result_text.value = message
+            page.update(resistance_result_text)
+
+        live_resistance = LiveCalculation(resistance_message, show_resistance_message)
+        live_calculations.append(live_resistance)
+
+        def recalculate_live():
+            if live_resistance_switch.value:
+                live_resistance.submit(resistances_input.value, configuration_dropdown_r.value)
+
+        def on_live_resistance_change(e):
+            if live_resistance_switch.value:
+                recalculate_live()
+            else:
+                live_resistance.cancel()
+
+        live_resistance_switch = ft.Switch(label="Live results", value=False, on_change=on_live_resistance_change)
+        resistances_input.on_change = lambda e: recalculate_live()
+
+        @profiling.handler("on_calculate_resistance")
+        def on_calculate_resistance(e):
+            live_resistance.cancel()  # A pending live result is older than this one
+            show_resistance_message(resistance_message(resistances_input.value, configuration_dropdown_r.value))
+
+        resistance_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=on_calculate_resistance,
+            style=button_style
+        )
+        resistance_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Resistance", size=24, weight="bold"),
+                ft.Text("Resistance measures how much a material opposes electric current."),
+                ft.Text("Formula: R = ρ x (L / A)")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Resistance Calculation", [
             resistances_input,
+            resistance_file_button,
             configuration_dropdown_r,
             resistance_img,
             resistance_calculate_button,
+            live_resistance_switch,
             resistance_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(resistance_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            resistance_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
-
-    electric_force_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Electric Force Calculation", size=20, color="black"),
+            optional_panel("Tolerance analysis", lambda: tolerance_panel(
+                "analyze_resistance_tolerance", read_resistances, resistances_input, configuration_dropdown_r, "Ω")),
+            optional_panel("Standard parts", lambda: standard_parts_panel("resistance", "Ω")),
+        ], resistance_explanation)
+
+    def build_electric_force_page():
+        charge1 = ft.TextField(label="Charge 1 (C)", width=200, color="black")
+        charge2 = ft.TextField(label="Charge 2 (C)", width=200, color="black")
+        distance = ft.TextField(label="Distance (m)", width=200, color="black")
+        electric_force_result_text = ft.Text("", size=14, color="black")
+
+        @profiling.handler("on_calculate_electric_force")
+        def on_calculate_electric_force(e):
+            try:
+                q1 = float(charge1.value)
+                q2 = float(charge2.value)
+                d = float(distance.value)
+                result = calculate_electric_force(q1, q2, d)
+                electric_force_result_text.value = f"Electric Force: {result:.2e} N" if isinstance(result, float) else result
+            except ValueError:
+                electric_force_result_text.value = "Error: Invalid input. Please enter numeric values."
+            page.update(electric_force_result_text)
+
+        electric_force_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=on_calculate_electric_force,
+            style=button_style
+        )
+        electric_force_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Electric Force", size=24, weight="bold"),
+                ft.Text("Electric force is the interaction between charged particles."),
+                ft.Text("Like charges repel; opposite charges attract."),
+                ft.Text("Coulomb's Law: F = k * |q1 * q2| / r²"),
+                ft.Text("Where:"),
+                ft.Text("• F is the electric force"),
+                ft.Text("• q1 and q2 are the charges"),
+                ft.Text("• r is the distance between charges"),
+                ft.Text("• k ≈ 8.99 × 10⁹ N·m²/C² (Coulomb's constant)")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Electric Force Calculation", [
             charge1,
             charge2,
             distance,
             electric_force_calculate_button,
             electric_force_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(electric_force_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            electric_force_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
-
-    magneticfield_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Magnetic Field Calculation", size=20, color="black"),
+            optional_panel("Distance sweep", lambda: sweep_panel(
+                "electric_force", lambda: {"charge1": float(charge1.value), "charge2": float(charge2.value)},
+                "Force (N)")),
+        ], electric_force_explanation)
+
+    def build_magneticfield_page():
+        current_magnetic_field = ft.TextField(label="Current (A)", width=200, color="black")
+        distance_magnetic_field = ft.TextField(label="Distance (m)", width=200, color="black")
+        magnetic_field_result_text = ft.Text("", size=14, color="black")
+
+        @profiling.handler("on_calculate_magnetic_field")
+        def on_calculate_magnetic_field(e):
+            try:
+                i = float(current_magnetic_field.value)
+                d = float(distance_magnetic_field.value)
+                result = calculate_magnetic_field(i, d)
+                magnetic_field_result_text.value = f"Magnetic Field: {result:.2e} T" if isinstance(result, float) else result
+            except ValueError:
+                magnetic_field_result_text.value = "Error: Invalid input. Please enter numeric values."
+            page.update(magnetic_field_result_text)
+
+        magneticfield_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=on_calculate_magnetic_field,
+            style=button_style
+        )
+        magneticfield_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Magnetic Field", size=24, weight="bold"),
+                ft.Text("The magnetic field describes the magnetic influence of electric currents."),
+                ft.Text("Formula (Straight Wire): B = (μ₀ × I) / (2πr)")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Magnetic Field Calculation", [
             current_magnetic_field,
             distance_magnetic_field,
             magneticfield_calculate_button,
             magnetic_field_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(magneticfield_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            magneticfield_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
-
-    electricfield_page = ft.Container(
-        content=ft.Column([
-            ft.Text("Electric Field Calculation", size=20, color="black"),
+            optional_panel("Distance sweep", lambda: sweep_panel(
+                "magnetic_field", lambda: {"current": float(current_magnetic_field.value)}, "Magnetic Field (T)")),
+        ], magneticfield_explanation)
+
+    def build_electricfield_page():
+        charge1_electric_field = ft.TextField(label="Charge (C)", width=200, color="black")
+        distance_electric_field = ft.TextField(label="Distance (m)", width=200, color="black")
+        electric_field_result_text = ft.Text("", size=14, color="black")
+
+        @profiling.handler("on_calculate_electric_field")
+        def on_calculate_electric_field(e):
+            try:
+                q = float(charge1_electric_field.value)
+                d = float(distance_electric_field.value)
+                result = calculate_electric_field(q, d)
+                electric_field_result_text.value = f"Electric Field: {result:.2e} N/C" if isinstance(result, float) else result
+            except ValueError:
+                electric_field_result_text.value = "Error: Invalid input. Please enter numeric values."
+            page.update(electric_field_result_text)
+
+        electricfield_calculate_button = ft.ElevatedButton(
+            "Calculate", on_click=on_calculate_electric_field,
+            style=button_style
+        )
+        electricfield_explanation = add_hide_button(ft.Container(
+            content=ft.Column([
+                ft.Text("Electric Field", size=24, weight="bold"),
+                ft.Text("Electric fields show the force per unit charge in space."),
+                ft.Text("Formula (Point Charge): E = k * q / r²")
+            ]),
+            bgcolor="#849bff", visible=False, padding=10, border_radius=10
+        ))
+        return calculator_page("Electric Field Calculation", [
             charge1_electric_field,
             distance_electric_field,
             electricfield_calculate_button,
             electric_field_result_text,
-            ft.ElevatedButton(
-                "Show Explanation", on_click=lambda e: show_explanation(electricfield_explanation),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            ),
-            electricfield_explanation,
-            ft.ElevatedButton(
-                "Back", on_click=lambda e: show_page(home_view, None),
-                style=ft.ButtonStyle(bgcolor="#849bff", color="white", shape=ft.RoundedRectangleBorder(radius=20))
-            )
-        ], alignment=ft.alignment.center),
-        bgcolor="#FCFBF4",
-        width=page.window.width,
-        height=page.window.height,
-        visible=False,
-        alignment=ft.alignment.center
-    )
+            optional_panel("Distance sweep", lambda: sweep_panel(
+                "electric_field", lambda: {"charge": float(charge1_electric_field.value)}, "Electric Field (N/C)")),
+        ], electricfield_explanation)
+
+    def build_diagnostics_page():
+        """Latency histograms recorded by the profiling module; reached with Ctrl+Shift+D."""
+        diagnostics_text = ft.Text("", size=12, color="black", font_family="monospace", selectable=True)
+
+        def refresh_diagnostics(e=None):
+            rows = [f"{'name':<34} {'phase':<8} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+            for name, phases in profiling.snapshot().items():
+                for phase, histogram in phases.items():
+                    rows.append(f"{name:<34} {phase:<8} {histogram['count']:>7} "
+                                + " ".join(f"{histogram[key] * 1000:>9.3f}"
+                                           for key in ("p50_seconds", "p90_seconds", "p99_seconds", "max_seconds")))
+            diagnostics_text.value = "\n".join(rows) if len(rows) > 1 else "No latencies recorded yet."
+            if e is not None:
+                page.update(diagnostics_text)
+
+        refresh_diagnostics()
+        container = ft.Container(
+            content=ft.Column([
+                ft.Text("Diagnostics", size=20, color="black"),
+                diagnostics_text,
+                ft.Row([
+                    ft.ElevatedButton(
+                        "Refresh", on_click=refresh_diagnostics,
+                        style=button_style
+                    ),
+                    ft.ElevatedButton(
+                        "Back", on_click=lambda e: show_page("home"),
+                        style=button_style
+                    ),
+                ], alignment=ft.MainAxisAlignment.CENTER),
+            ], alignment=ft.alignment.center, scroll=ft.ScrollMode.AUTO),
+            bgcolor="#FCFBF4",
+            width=page.window.width,
+            height=page.window.height,
+            visible=False,
+            alignment=ft.alignment.center
+        )
+        return container, None
+
+    page_builders = {
+        "ohms_law": build_ohms_law_page,
+        "capacitance": build_capacitance_page,
+        "resistance": build_resistance_page,
+        "electric_force": build_electric_force_page,
+        "magneticfield": build_magneticfield_page,
+        "electricfield": build_electricfield_page,
+    }
+    built_pages = {}
+
+    home_view = ft.Container(
+    content=ft.Column([
+        title,
+        ft.ResponsiveRow([
+            ft.Column([
+                ft.ElevatedButton(
+                    "Ohm's Law", on_click=lambda e: show_page("ohms_law"),
+                    width=400, height=120, style=button_style
+                ),
+                ft.ElevatedButton(
+                    "Capacitance", on_click=lambda e: show_page("capacitance"),
+                    width=400, height=120, style=button_style
+                ),
+                ft.ElevatedButton(
+                    "Resistance", on_click=lambda e: show_page("resistance"),
+                    width=400, height=120, style=button_style
+                ),
+            ], spacing=20, alignment=ft.MainAxisAlignment.CENTER, col={"sm": 6, "md": 6, "lg": 6}),
+            ft.Column([
+                ft.ElevatedButton(
+                    "Electric Force", on_click=lambda e: show_page("electric_force"),
+                    width=400, height=120, style=button_style
+                ),
+                ft.ElevatedButton(
+                    "Magnetic Field", on_click=lambda e: show_page("magneticfield"),
+                    width=400, height=120, style=button_style
+                ),
+                ft.ElevatedButton(
+                    "Electric Field", on_click=lambda e: show_page("electricfield"),
+                    width=400, height=120, style=button_style
+                ),
+            ], spacing=20, alignment=ft.MainAxisAlignment.CENTER, col={"sm": 6, "md": 6, "lg": 6}),
+        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20),
+    ], alignment=ft.MainAxisAlignment.CENTER, spacing=30),
+    bgcolor="#FCFBF4",
+    width=page.window.width,
+    height=page.window.height,
+    visible=True,
+    alignment=ft.alignment.center,
+    padding=ft.padding.symmetric(vertical=50, horizontal=20)
+)
 
     # Navigation Function
-    def show_page(page_to_show, explanation_container):
-        for p in [home_view, ohms_law_page, capacitance_page, resistance_page,
-                  electric_force_page, magneticfield_page, electricfield_page]:
-            p.visible = False
-        page_to_show.visible = True
-        hide_explanation()
-        if explanation_container:
-            show_explanation(explanation_container)
-        page.update()
-
-    # Stack Views
-    views = ft.Stack(controls=[
-        home_view, ohms_law_page, capacitance_page, resistance_page,
-        electric_force_page, magneticfield_page, electricfield_page
-    ])
+    @profiling.handler("show_page")
+    def show_page(name):
+        if name == "home":
+            page_to_show, explanation_container = home_view, None
+            new_page = False
+        else:
+            new_page = name not in built_pages
+            if new_page:
+                built_pages[name] = page_builders[name]()
+                views.controls.append(built_pages[name][0])
+            page_to_show, explanation_container = built_pages[name]
+        changed = []
+        for p in views.controls:
+            if p.visible and p is not page_to_show:
+                p.visible = False
+                changed.append(p)
+        if not page_to_show.visible:
+            page_to_show.visible = True
+            changed.append(page_to_show)
+        changed += set_explanation(explanation_container)
+        # A newly built page has to be added to the stack, which also carries the other changes
+        if new_page:
+            page.update(views)
+        else:
+            update_controls(*changed)
+
+    # Stack Views; calculator pages are appended the first time they are shown
+    views = ft.Stack(controls=[home_view])
     page.add(views)
 
-ft.app(target=main)
\ No newline at end of file
+    # The diagnostics page is hidden unless profiling is enabled
+    if profiling.ENABLED:
+        page_builders["diagnostics"] = build_diagnostics_page
+
+        def on_keyboard(e):
+            if e.ctrl and e.shift and e.key == "D":
+                show_page("diagnostics")
+
+        page.on_keyboard_event = on_keyboard
+
+if __name__ == "__main__":
+    import argparse
+
+    import flet as ft
+    parser = argparse.ArgumentParser(description="Physics Calculator")
+    parser.add_argument("--web", action="store_true", help="serve the app to browsers instead of opening a window")
+    parser.add_argument("--port", type=int, default=8550, help="port for --web (default 8550)")
+    args = parser.parse_args()
+    # One exporter per process, however many sessions the web server runs
+    profiling.start_exporter()
+    if args.web:
+        # Every browser session runs main() on its own page; the button style and caches are shared
+        ft.app(target=main, view=None, port=args.port)
+    else:
+        ft.app(target=main)
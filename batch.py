@@ -0,0 +1,113 @@
+"""Vectorized series/parallel totals for many capacitor or resistor networks at once.
+
+Networks are passed ragged, either as a flat value array plus offsets (network
+i owns values[offsets[i]:offsets[i + 1]]) or as a list of per-network arrays.
+Instead of error strings every call returns a results array and an error-code
+array; failed networks get NaN in the results.
+"""
+import numpy as np
+
+SERIES = 0
+PARALLEL = 1
+
+OK = 0
+ERROR_EMPTY = 1
+ERROR_NOT_POSITIVE = 2
+ERROR_CONFIGURATION = 3
+
+ERROR_MESSAGES = {
+    "capacitance": {
+        ERROR_EMPTY: "Error: At least one capacitance value is required.",
+        ERROR_NOT_POSITIVE: "Error: All capacitance values must be positive.",
+        ERROR_CONFIGURATION: "Error: Configuration must be 'Series' or 'Parallel'.",
+    },
+    "resistance": {
+        ERROR_EMPTY: "Error: At least one resistance value is required.",
+        ERROR_NOT_POSITIVE: "Error: All resistance values must be positive.",
+        ERROR_CONFIGURATION: "Error: Configuration must be 'Series' or 'Parallel'.",
+    },
+}
+
+
+def as_ragged(values, offsets=None):
+    """Returns (flat float64 values, int64 offsets) from either ragged input form."""
+    if offsets is None:
+        arrays = [np.asarray(v, dtype=np.float64).ravel() for v in values]
+        lengths = np.fromiter((a.size for a in arrays), dtype=np.int64, count=len(arrays))
+        flat = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return flat, offsets
+    flat = np.asarray(values, dtype=np.float64).ravel()
+    offsets = np.asarray(offsets, dtype=np.int64).ravel()
+    if offsets.size == 0 or offsets[0] != 0 or np.any(np.diff(offsets) < 0) or offsets[-1] > flat.size:
+        raise ValueError("offsets must start at 0, be non-decreasing and end within the value array")
+    return flat, offsets
+
+
+def as_configurations(configurations, count):
+    """Returns an int8 array of SERIES/PARALLEL flags, -1 marking invalid entries."""
+    if isinstance(configurations, str):
+        configurations = [configurations]
+    flags = np.asarray(configurations)
+    if flags.dtype.kind in "USO":
+        codes = np.full(flags.shape, -1, dtype=np.int8)
+        codes[flags == "Series"] = SERIES
+        codes[flags == "Parallel"] = PARALLEL
+    else:
+        codes = np.where((flags == SERIES) | (flags == PARALLEL), flags, -1).astype(np.int8)
+    codes = codes.ravel()
+    if codes.size == 1:
+        return np.full(count, codes[0], dtype=np.int8)
+    if codes.size != count:
+        raise ValueError("Expected one configuration or one per network")
+    return codes
+
+
+def segment_totals(flat, offsets, reciprocal):
+    """Sums each segment, using 1/x and inverting the sum where `reciprocal` is set.
+
+    Returns (totals, error codes); `reciprocal` holds one flag per segment.
+    """
+    lengths = np.diff(offsets)
+    count = lengths.size
+    flat = flat[:offsets[-1]]
+    totals = np.full(count, np.nan)
+    errors = np.zeros(count, dtype=np.int8)
+    errors[lengths == 0] = ERROR_EMPTY
+    nonempty = lengths > 0
+    if not flat.size:
+        return totals, errors
+
+    starts = offsets[:-1][nonempty]
+    not_positive = np.logical_or.reduceat(flat <= 0, starts)
+    errors[np.flatnonzero(nonempty)[not_positive]] = ERROR_NOT_POSITIVE
+
+    terms = flat.copy()
+    per_value = np.repeat(reciprocal, lengths)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(1.0, terms, out=terms, where=per_value)
+        sums = np.add.reduceat(terms, starts)
+        totals[nonempty] = np.where(reciprocal[nonempty], 1.0 / sums, sums)
+    totals[errors != OK] = np.nan
+    return totals, errors
+
+
+def _calculate_batch(values, offsets, configurations, reciprocal_configuration):
+    flat, offsets = as_ragged(values, offsets)
+    codes = as_configurations(configurations, offsets.size - 1)
+    totals, errors = segment_totals(flat, offsets, codes == reciprocal_configuration)
+    invalid = (codes < 0) & (errors == OK)
+    errors[invalid] = ERROR_CONFIGURATION
+    totals[invalid] = np.nan
+    return totals, errors
+
+
+def calculate_capacitance_batch(values, configurations, offsets=None):
+    """Calculates total capacitance for many networks, see calculate_capacitance."""
+    return _calculate_batch(values, offsets, configurations, SERIES)
+
+
+def calculate_resistance_batch(values, configurations, offsets=None):
+    """Calculates total resistance for many networks, see calculate_resistance."""
+    return _calculate_batch(values, offsets, configurations, PARALLEL)
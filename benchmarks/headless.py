@@ -0,0 +1,126 @@
+"""Headless stand-in for ft.Page, so the Flet UI in Tech-fest.py can be driven without a window.
+
+HeadlessPage only counts update calls. recording_page() returns a real
+ft.Page on a connection that keeps the control tree server-side and records
+the messages that would go to the client, so payload sizes can be measured.
+"""
+import asyncio
+import importlib.util
+import json
+import os
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app(path=None):
+    """Imports Tech-fest.py (or another copy of it) as a module; importing it does not start the app."""
+    spec = importlib.util.spec_from_file_location("tech_fest", path or os.path.join(ROOT, "Tech-fest.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class HeadlessPage:
+    """Just enough of ft.Page for main(); records update calls instead of sending them."""
+
+    def __init__(self, width=1280, height=800):
+        self.window = types.SimpleNamespace(width=width, height=height, maximized=False, resizable=True)
+        self.controls = []
+        self.overlay = []
+        self.updates = 0
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+        self.update()
+
+    def update(self, *controls):
+        self.updates += 1
+
+
+def recording_page(loop=None):
+    """Returns a real ft.Page whose connection records every batch of commands it would send.
+
+    Pages that stand for concurrent sessions can share one event loop, as on the web server.
+    """
+    import flet as ft
+    from flet.core.local_connection import LocalConnection
+    from flet.core.protocol import ClientActions, ClientMessage, CommandEncoder, PageCommandsBatchResponsePayload
+
+    class RecordingConnection(LocalConnection):
+        def __init__(self):
+            super().__init__()
+            self.batches = 0
+            self.bytes_sent = 0
+
+        def send_commands(self, session_id, commands):
+            results = []
+            messages = []
+            for command in commands:
+                result, message = self._process_command(command)
+                if command.name in ("add", "get"):
+                    results.append(result)
+                if message:
+                    messages.append(message)
+            if messages:
+                self.batches += 1
+                self.bytes_sent += len(json.dumps(ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages),
+                                                  cls=CommandEncoder, separators=(",", ":")))
+            return PageCommandsBatchResponsePayload(results=results, error="")
+
+    return ft.Page(RecordingConnection(), "headless", loop or asyncio.new_event_loop())
+
+
+def children(control):
+    """Returns the direct child controls of a container, column, row or stack."""
+    found = list(getattr(control, "controls", None) or [])
+    content = getattr(control, "content", None)
+    if content is not None and not isinstance(content, str):
+        found.append(content)
+    return found
+
+
+def walk(control):
+    """Yields a control and all of its descendants, depth first."""
+    stack = [control]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(children(current)))
+
+
+def visible_view(page):
+    """Returns the page-level container that is currently shown."""
+    for control in page.controls[0].controls:
+        if control.visible:
+            return control
+    raise LookupError("No visible view")
+
+
+def find(root, predicate):
+    for control in walk(root):
+        if predicate(control):
+            return control
+    raise LookupError("Control not found")
+
+
+def button(root, text):
+    return find(root, lambda c: getattr(c, "text", None) == text and hasattr(c, "on_click"))
+
+
+def field(root, label):
+    """Returns the text field or dropdown with this label."""
+    return find(root, lambda c: getattr(c, "label", None) == label and hasattr(c, "on_change"))
+
+
+def click(root, text):
+    """Calls the on_click handler of the button with this text."""
+    button(root, text).on_click(None)
+
+
+def start(app=None, page=None):
+    """Runs main() against a fresh HeadlessPage (or the given page) and returns the page."""
+    app = app or load_app()
+    page = page or HeadlessPage()
+    app.main(page)
+    return page
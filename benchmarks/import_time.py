@@ -0,0 +1,51 @@
+"""Cold-start import benchmark for worker processes.
+
+Compares a fresh interpreter importing the headless `calculators` module
+against one that also has to load Flet, which is what every worker paid when
+the formulas only lived in Tech-fest.py.
+
+Run from the repository root: python -m benchmarks.import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "python (empty)": "pass",
+    "calculators": "import calculators",
+    "calculators + flet": "import calculators, flet",
+}
+
+
+def time_import(statement, repeat):
+    """Returns wall-clock seconds for `repeat` fresh interpreters running `statement`."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main(repeat=10):
+    results = {}
+    for name, statement in CASES.items():
+        try:
+            samples = time_import(statement, repeat)
+        except subprocess.CalledProcessError:
+            print(f"{name:<22} skipped (import failed)")
+            continue
+        results[name] = statistics.median(samples)
+        print(f"{name:<22} median {results[name] * 1000:8.1f} ms over {repeat} runs")
+    if "calculators" in results and "calculators + flet" in results:
+        saved = results["calculators + flet"] - results["calculators"]
+        print(f"Cold-start saved per worker: {saved * 1000:.1f} ms "
+              f"({results['calculators + flet'] / results['calculators']:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
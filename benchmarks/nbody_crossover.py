@@ -0,0 +1,43 @@
+"""Exact vs Barnes–Hut Coulomb force timings, to locate the crossover point.
+
+Run from the repository root: python -m benchmarks.nbody_crossover [theta]
+"""
+import sys
+import time
+
+import numpy as np
+
+from nbody import AUTO_THRESHOLD, coulomb_forces
+
+SIZES = [250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 100000]
+EXACT_LIMIT = 16000
+
+
+def time_mode(charges, positions, mode, theta):
+    start = time.perf_counter()
+    forces = np.column_stack(coulomb_forces(charges, positions, mode=mode, theta=theta))
+    return time.perf_counter() - start, forces
+
+
+def main(theta=0.5):
+    rng = np.random.default_rng(0)
+    crossover = None
+    print(f"theta = {theta}, AUTO_THRESHOLD = {AUTO_THRESHOLD}")
+    print(f"{'N':>8} {'exact s':>10} {'barnes-hut s':>13} {'median rel err':>15}")
+    for n in SIZES:
+        charges = rng.normal(size=n) * 1e-9
+        positions = rng.random((n, 3))
+        bh_time, approx = time_mode(charges, positions, "barnes-hut", theta)
+        if n > EXACT_LIMIT:
+            print(f"{n:>8} {'-':>10} {bh_time:>13.3f} {'-':>15}")
+            continue
+        exact_time, exact = time_mode(charges, positions, "exact", theta)
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        print(f"{n:>8} {exact_time:>10.3f} {bh_time:>13.3f} {np.median(error):>15.2e}")
+        if crossover is None and bh_time < exact_time:
+            crossover = n
+    print(f"Barnes–Hut is faster from N ≈ {crossover}" if crossover else "No crossover in the tested range")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5)
@@ -0,0 +1,57 @@
+"""Throughput of the reproducible multi-process reduction, in values per second.
+
+    python -m benchmarks.parallel_reduction [--size 10000000] [--workers 1 2 4 8]
+
+Times calculate_resistance_parallel in both configurations for each worker
+count, from a plain array (copied into shared memory on every call) and
+from a SharedValues (copied once). Each time is the best of three, so
+starting the pool is not counted. Also checks that every worker count gives
+bitwise the same total. The scalar calculate_resistance is timed on the
+first million values for reference.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from calculators import calculate_resistance
+from parallel_reduction import SharedValues, calculate_resistance_parallel
+
+SCALAR_SIZE = 10 ** 6
+
+
+def best_of(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the multi-process series/parallel reduction.")
+    parser.add_argument("--size", type=int, default=10 ** 7)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, os.cpu_count() or 1}))
+    args = parser.parse_args(argv)
+
+    values = np.random.default_rng(0).uniform(1, 1000, args.size)
+    scalar_values = values[:SCALAR_SIZE].tolist()
+    with SharedValues(values) as shared:
+        for configuration in ("Series", "Parallel"):
+            _, seconds = best_of(lambda: calculate_resistance(scalar_values, configuration), repeat=1)
+            print(f"{configuration:<9} scalar calculate_resistance        {len(scalar_values) / seconds:14,.0f} values/s")
+            totals = set()
+            for workers in args.workers:
+                for source, label in ((values, "array"), (shared, "SharedValues")):
+                    total, seconds = best_of(lambda: calculate_resistance_parallel(source, configuration, workers))
+                    totals.add(total)
+                    print(f"{configuration:<9} {workers:>2} worker(s), {label:<12}    {args.size / seconds:14,.0f} "
+                          f"values/s   total {total.hex()}")
+            print(f"{configuration:<9} bitwise identical across worker counts: {len(totals) == 1}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Repeated-query benchmark for the series/parallel reduction cache.
+
+Simulates users and scripts re-running a working set of component lists with
+a skewed (Zipf-like) popularity. Each workload re-enters a different share
+of the queries with the parts in a new order; those pay for counting the
+values before they can hit.
+
+Run from the repository root: python -m benchmarks.reduction_cache
+"""
+import random
+import time
+
+from calculators import calculate_capacitance, calculate_resistance
+from reduction_cache import ReductionCache
+
+DISTINCT_LISTS = 400
+QUERIES = 50000
+LIST_SIZES = (2, 5, 20, 100, 500)
+REORDERED_SHARES = (0.0, 0.1, 1.0)
+
+
+def workload(rng, reordered_share):
+    lists = [[rng.choice((1.0, 2.2, 4.7, 10.0, 47.0, 100.0)) * 10 ** rng.randint(0, 5)
+              for _ in range(rng.choice(LIST_SIZES))] for _ in range(DISTINCT_LISTS)]
+    configurations = [rng.choice(("Series", "Parallel")) for _ in lists]
+    weights = [1.0 / (rank + 1) for rank in range(DISTINCT_LISTS)]
+    queries = []
+    for index in rng.choices(range(DISTINCT_LISTS), weights, k=QUERIES):
+        values = lists[index]
+        if rng.random() < reordered_share:
+            values = values[:]
+            rng.shuffle(values)
+        queries.append((values, configurations[index]))
+    return queries
+
+
+def run(function, queries):
+    start = time.perf_counter()
+    for values, configuration in queries:
+        function(values, configuration)
+    return time.perf_counter() - start
+
+
+def main():
+    for share in REORDERED_SHARES:
+        queries = workload(random.Random(0), share)
+        print(f"{share:.0%} of queries reordered")
+        for name, function in (("capacitance", calculate_capacitance), ("resistance", calculate_resistance)):
+            uncached = run(function, queries)
+            cache = ReductionCache(function)
+            cached = run(cache, queries)
+            info = cache.info()
+            print(f"  {name:<12} uncached {uncached * 1000:7.1f} ms  cached {cached * 1000:7.1f} ms  "
+                  f"speedup {uncached / cached:4.1f}x  hit rate {info['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
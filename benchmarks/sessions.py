@@ -0,0 +1,132 @@
+"""Load test: many concurrent web sessions of the Flet app, with memory per session and latency percentiles.
+
+    python -m benchmarks.sessions [--sessions 200] [--rounds 3] [--think 0.05] [--app path/to/Tech-fest.py]
+
+Each session is a real ft.Page on a recording connection, all sharing one
+event loop like the Flet web server. The memory phase builds the sessions
+one after another under tracemalloc and reports the memory held per
+session after main() and after every page has been opened, and what is
+left once the sessions are closed. The load phase starts every session at
+once on a thread pool, as the web server runs event handlers, and each
+session starts up, replays the interactions of benchmarks.updates `rounds`
+times with a random think time between them, and closes. Latencies include
+waiting for the interpreter, so p99 shows how sessions slow each other down.
+"""
+import argparse
+import asyncio
+import gc
+import random
+import resource
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import headless
+from benchmarks.updates import interactions
+
+
+def close(page):
+    """Ends a session like the web server does: the page's close handler runs, then the page is disposed."""
+    if page.on_close:
+        page.on_close(None)
+    page._close()
+
+
+def open_every_page(page):
+    home = headless.visible_view(page)
+    for name, action in interactions(page, home):
+        if name.startswith(("open", "back")):
+            action()
+
+
+def memory_phase(app, sessions, loop):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    pages = []
+    for _ in range(sessions):
+        pages.append(headless.start(app, headless.recording_page(loop)))
+    gc.collect()
+    started = tracemalloc.get_traced_memory()[0]
+    for page in pages:
+        open_every_page(page)
+    gc.collect()
+    opened = tracemalloc.get_traced_memory()[0]
+    for page in pages:
+        close(page)
+    del pages, page
+    gc.collect()
+    closed = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"memory per session after main()          {(started - start) / sessions / 1024:10.1f} KiB")
+    print(f"memory per session with every page open  {(opened - start) / sessions / 1024:10.1f} KiB")
+    print(f"memory left per closed session           {(closed - start) / sessions / 1024:10.1f} KiB")
+
+
+def run_session(app, loop, rounds, think, seed, latencies, lock):
+    rng = random.Random(seed)
+    timings = []
+    start = time.perf_counter()
+    page = headless.start(app, headless.recording_page(loop))
+    timings.append(("start session", time.perf_counter() - start))
+    home = headless.visible_view(page)
+    for _ in range(rounds):
+        for name, action in interactions(page, home):
+            if think:
+                time.sleep(rng.expovariate(1 / think))
+            start = time.perf_counter()
+            action()
+            timings.append((name.split(" ", 1)[0], time.perf_counter() - start))
+    start = time.perf_counter()
+    close(page)
+    timings.append(("close session", time.perf_counter() - start))
+    with lock:
+        latencies.extend(timings)
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+
+def load_phase(app, sessions, rounds, think, loop):
+    latencies, lock = [], threading.Lock()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for future in [pool.submit(run_session, app, loop, rounds, think, seed, latencies, lock)
+                       for seed in range(sessions)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    groups = {}
+    for name, seconds in latencies:
+        groups.setdefault(name, []).append(seconds)
+    groups["all interactions"] = [s for name, s in latencies if not name.endswith("session")]
+    print(f"{sessions} concurrent sessions, {len(groups['all interactions'])} interactions in {elapsed:.1f} s")
+    print(f"{'':<18} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, values in groups.items():
+        values.sort()
+        print(f"{name:<18} {len(values):>7} {statistics.median(values) * 1e3:9.2f} "
+              f"{percentile(values, 90) * 1e3:9.2f} {percentile(values, 99) * 1e3:9.2f} {values[-1] * 1e3:9.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent sessions of the Flet app.")
+    parser.add_argument("--app", help="path to a Tech-fest.py to measure (default: the current one)")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--think", type=float, default=0.05, help="mean seconds between a session's interactions")
+    args = parser.parse_args(argv)
+
+    app = headless.load_app(args.app)
+    loop = asyncio.new_event_loop()
+    # One warm-up session, so imports and first-call caches are not counted
+    close(headless.start(app, headless.recording_page(loop)))
+    memory_phase(app, args.sessions, loop)
+    load_phase(app, args.sessions, args.rounds, args.think, loop)
+    print(f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
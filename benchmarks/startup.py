@@ -0,0 +1,51 @@
+"""Startup benchmark: time-to-first-frame and control count of main().
+
+The first frame is main() building the UI plus serializing every added
+control into the add commands Flet sends to the client, measured against a
+HeadlessPage. Flet itself is imported before timing starts.
+
+Run from the repository root:
+
+    python -m benchmarks.startup [--app path/to/other/Tech-fest.py] [--repeat 20]
+
+Pass --app with an older copy of Tech-fest.py (e.g. from `git show`) to
+compare before and after.
+"""
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks import headless
+
+
+def first_frame(app):
+    """Returns (seconds, control count, payload bytes) for one cold main() call."""
+    page = headless.HeadlessPage()
+    start = time.perf_counter()
+    app.main(page)
+    commands = [command for control in page.controls for command in control._build_add_commands()]
+    elapsed = time.perf_counter() - start
+    payload = json.dumps(commands, default=vars)
+    return elapsed, len(commands), len(payload.encode())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure time-to-first-frame of the Flet app.")
+    parser.add_argument("--app", help="path to a Tech-fest.py to measure (default: this checkout)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    import flet  # noqa: F401  Imported up front so it is not part of the timing
+
+    app = headless.load_app(args.app)
+    samples = [first_frame(app) for _ in range(args.repeat)]
+    seconds = statistics.median(s[0] for s in samples)
+    _, controls, payload = samples[-1]
+    print(f"time to first frame {seconds * 1000:8.2f} ms (median of {args.repeat})")
+    print(f"controls sent       {controls:8d}")
+    print(f"first frame payload {payload:8d} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Benchmark suite for every calculator and UI handler, with JSON baselines.
+
+    python -m benchmarks.suite run -o baseline.json [--max-size 1000000]
+    python -m benchmarks.suite compare baseline.json current.json [--threshold 0.1]
+
+`run` times each calculate_* function for input sizes 1, 10, ... up to
+--max-size (list length for capacitance/resistance, number of calls for the
+scalar formulas), value_parser on lists of those lengths and distance sweeps
+with that many points, plus E-series searches with 2 and 4 parts. It also times the on_calculate_* and Ohm's law handlers
+(parsing included) and show_page navigation, driven through a HeadlessPage.
+Handler and navigation timings need Flet installed and are skipped otherwise.
+`compare` exits with status 1 if any benchmark got slower than the threshold.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from calculators import (calculate_capacitance, calculate_electric_field, calculate_electric_force,
+                         calculate_magnetic_field, calculate_resistance)
+
+MIN_SECONDS = 0.2
+MIN_SAMPLE_SECONDS = 0.005
+MAX_REPEAT = 25
+HANDLER_MAX_SIZE = 10 ** 6
+
+PAGES = ("Ohm's Law", "Capacitance", "Resistance", "Electric Force", "Magnetic Field", "Electric Field")
+
+
+def measure(function, setup=None):
+    """Returns the best seconds per function() call over enough repeats to fill MIN_SECONDS.
+
+    Fast calls are looped so each sample lasts at least MIN_SAMPLE_SECONDS;
+    setup() runs before every call and is included in the timing.
+    """
+    def sample(number):
+        start = time.perf_counter()
+        for _ in range(number):
+            if setup:
+                setup()
+            function()
+        return (time.perf_counter() - start) / number
+
+    number = 1
+    while (first := sample(number)) * number < MIN_SAMPLE_SECONDS:
+        number *= 10
+    samples = [first]
+    deadline = time.perf_counter() + MIN_SECONDS
+    while len(samples) < 3 or (time.perf_counter() < deadline and len(samples) < MAX_REPEAT):
+        samples.append(sample(number))
+    return min(samples)
+
+
+def sizes(max_size):
+    size = 1
+    while size <= max_size:
+        yield size
+        size *= 10
+
+
+def calculator_benchmarks(max_size, rng):
+    """Yields (name, size, seconds) for every calculate_* function."""
+    for size in sizes(max_size):
+        values = [rng.uniform(1, 1000) for _ in range(size)]
+        for function in (calculate_capacitance, calculate_resistance):
+            for configuration in ("Series", "Parallel"):
+                yield (f"{function.__name__}[{configuration}]", size,
+                       measure(lambda: function(values, configuration)))
+
+        def repeat(function, *arguments):
+            def run():
+                for _ in range(size):
+                    function(*arguments)
+            return run
+
+        yield "calculate_electric_force", size, measure(repeat(calculate_electric_force, 1e-6, 2e-6, 0.5))
+        yield "calculate_electric_field", size, measure(repeat(calculate_electric_field, 3e-9, 2.0))
+        yield "calculate_magnetic_field", size, measure(repeat(calculate_magnetic_field, 3.0, 0.2))
+
+
+def parser_benchmarks(max_size, rng):
+    """Yields (name, size, seconds) for value_parser on plain and SI-suffixed lists."""
+    from value_parser import parse_values
+
+    for size in sizes(min(max_size, HANDLER_MAX_SIZE)):
+        plain = [f"{rng.uniform(1, 1000):.3f}" for _ in range(size)]
+        suffixed = [value + rng.choice("pnumkM") for value in plain]
+        yield "parse_values[plain]", size, measure(lambda: parse_values(", ".join(plain)))
+        yield "parse_values[si]", size, measure(lambda: parse_values(", ".join(suffixed)))
+
+
+def sweep_benchmarks(max_size):
+    """Yields (name, size, seconds) for sweeps plus downsampling to chart size."""
+    from sweep import downsample, sweep
+
+    for size in sizes(min(max_size, 10 ** 7)):
+        if size >= 10:
+            yield "sweep+lttb[electric_field]", size, measure(
+                lambda: downsample(*sweep("electric_field", {"charge": 3e-9}, 0.01, 1.0, size)))
+
+
+def standard_parts_benchmarks(rng):
+    """Yields (name, size, seconds) for E-series searches with up to `size` parts, index already built."""
+    from eseries import half_index, search
+
+    for series in ("E12", "E24", "E96"):
+        half_index(series, "resistance")
+        targets = [10 ** rng.uniform(1, 6) for _ in range(20)]
+        for parts in (2, 4):
+            yield f"eseries.search[{series}]", parts, measure(
+                lambda: [search(target, "resistance", series, parts) for target in targets]) / len(targets)
+
+
+def ui_benchmarks(max_size, rng):
+    """Yields (name, size, seconds) for the UI handlers and navigation."""
+    from benchmarks import headless
+    import reduction_cache
+
+    app = headless.load_app()
+    page = headless.start(app)
+    home = headless.visible_view(page)
+
+    def go_home():
+        if headless.visible_view(page) is not home:
+            headless.click(headless.visible_view(page), "Back")
+
+    def open_page(button_text):
+        go_home()
+        headless.click(home, button_text)
+        return headless.visible_view(page)
+
+    view = open_page("Ohm's Law")
+    voltage, current, resistance = (headless.field(view, label) for label in
+                                    ("Voltage (V)", "Current (A)", "Resistance (Ω)"))
+
+    def reset_ohms():
+        voltage.value, current.value, resistance.value = "12", "0.5", ""
+
+    yield "calculate_ohms_law", 1, measure(lambda: headless.click(view, "Calculate"), reset_ohms)
+
+    def clear_caches():
+        reduction_cache.cached_calculate_capacitance.clear()
+        reduction_cache.cached_calculate_resistance.clear()
+
+    for button_text, label in (("Capacitance", "Enter capacitances (comma-separated)"),
+                               ("Resistance", "Enter resistances (comma-separated)")):
+        view = open_page(button_text)
+        text = headless.field(view, label)
+        for size in sizes(min(max_size, HANDLER_MAX_SIZE)):
+            text.value = ",".join(f"{rng.uniform(1, 1000):.3f}" for _ in range(size))
+            yield (f"on_calculate_{button_text.lower()}", size,
+                   measure(lambda: headless.click(view, "Calculate"), clear_caches))
+
+    for button_text, inputs in (("Electric Force", {"Charge 1 (C)": "1e-6", "Charge 2 (C)": "2e-6",
+                                                    "Distance (m)": "0.5"}),
+                                ("Magnetic Field", {"Current (A)": "3", "Distance (m)": "0.2"}),
+                                ("Electric Field", {"Charge (C)": "3e-9", "Distance (m)": "2"})):
+        view = open_page(button_text)
+        for label, value in inputs.items():
+            headless.field(view, label).value = value
+        name = "on_calculate_" + button_text.lower().replace(" ", "_")
+        yield name, 1, measure(lambda: headless.click(view, "Calculate"))
+
+    go_home()
+    for button_text in PAGES:
+        def navigate():
+            headless.click(home, button_text)
+            headless.click(headless.visible_view(page), "Back")
+        yield f"show_page[{button_text}]", 1, measure(navigate)
+
+
+def run(output, max_size, seed=0):
+    rng = random.Random(seed)
+    results = {}
+
+    def record(name, size, seconds):
+        results[f"{name}@{size}"] = {"name": name, "size": size, "seconds": seconds}
+        print(f"{name:<42} {size:>9} {seconds * 1000:12.4f} ms", flush=True)
+
+    for entry in calculator_benchmarks(max_size, rng):
+        record(*entry)
+    for entry in parser_benchmarks(max_size, rng):
+        record(*entry)
+    for entry in sweep_benchmarks(max_size):
+        record(*entry)
+    for entry in standard_parts_benchmarks(rng):
+        record(*entry)
+    try:
+        import flet  # noqa: F401
+    except ImportError:
+        print("Flet is not installed, skipping handler and navigation benchmarks", file=sys.stderr)
+    else:
+        for entry in ui_benchmarks(max_size, rng):
+            record(*entry)
+
+    baseline = {"python": platform.python_version(), "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+    print(f"Saved {len(results)} results to {output}")
+
+
+def compare(baseline_path, current_path, threshold):
+    """Prints the ratio for every shared benchmark; returns the number of regressions."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    with open(current_path, encoding="utf-8") as f:
+        current = json.load(f)["results"]
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys(), key=lambda k: (baseline[k]["name"], baseline[k]["size"])):
+        ratio = current[key]["seconds"] / baseline[key]["seconds"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "faster"
+        print(f"{key:<52} {ratio:6.2f}x {flag}")
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{key:<52} missing from {current_path}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the physics calculators and UI handlers.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite and save a JSON baseline")
+    run_parser.add_argument("-o", "--output", default="benchmark_results.json")
+    run_parser.add_argument("--max-size", type=int, default=10 ** 7)
+    compare_parser = commands.add_parser("compare", help="compare two JSON results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed slowdown before flagging, as a fraction (default: 0.10)")
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run(args.output, args.max_size)
+    else:
+        sys.exit(1 if compare(args.baseline, args.current, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Messages, payload bytes and diff time per UI interaction, on a real ft.Page.
+
+    python -m benchmarks.updates [--app path/to/Tech-fest.py]
+
+The interactions are replayed REPEAT times after a first round that builds
+the pages; the best time per interaction is reported. The timed part is the
+server-side work: the handler, the control tree diff and encoding the
+messages. Typed values are set as if they came from the client, so they are
+not sent back. Pass --app with an older copy of Tech-fest.py to compare it
+against the current one.
+"""
+import argparse
+import time
+
+from benchmarks import headless
+
+REPEAT = 20
+
+INPUTS = {
+    "Ohm's Law": {"Voltage (V)": "12", "Current (A)": "0.5"},
+    "Capacitance": {"Enter capacitances (comma-separated)": "1, 2, 3"},
+    "Resistance": {"Enter resistances (comma-separated)": "10, 20, 30"},
+    "Electric Force": {"Charge 1 (C)": "1e-6", "Charge 2 (C)": "2e-6", "Distance (m)": "0.5"},
+    "Magnetic Field": {"Current (A)": "3", "Distance (m)": "0.2"},
+    "Electric Field": {"Charge (C)": "3e-9", "Distance (m)": "2"},
+}
+
+
+def interactions(page, home):
+    """Yields (name, action) pairs covering navigation and every handler once."""
+    for button_text, inputs in INPUTS.items():
+        def view():
+            return headless.visible_view(page)
+
+        def calculate(inputs=inputs):
+            for label, value in inputs.items():
+                # Values typed in the browser are already on the client, so they are not marked dirty
+                headless.field(view(), label)._set_attr("value", value, dirty=False)
+            headless.click(view(), "Calculate")
+
+        yield f"open {button_text}", lambda b=button_text: headless.click(home, b)
+        yield f"calculate {button_text}", calculate
+        if button_text in ("Capacitance", "Resistance"):
+            dropdown = lambda: headless.field(view(), "Configuration")
+            yield f"configuration {button_text}", lambda: dropdown().on_change(None)
+        yield f"show explanation {button_text}", lambda: headless.click(view(), "Show Explanation")
+        yield f"hide explanation {button_text}", lambda: headless.click(view(), "Hide")
+        yield f"back from {button_text}", lambda: headless.click(view(), "Back")
+
+
+def run(app_path=None, repeat=REPEAT):
+    app = headless.load_app(app_path)
+    page = headless.start(app, headless.recording_page())
+    connection = page._Page__conn
+    print(f"{'initial render':<36} {connection.batches:>3} msg {connection.bytes_sent:>8} B")
+    home = headless.visible_view(page)
+    # The first pass builds every page, later passes show steady-state navigation
+    traffic, best = {}, {}
+    for visit in range(repeat + 1):
+        for name, action in interactions(page, home):
+            batches, sent = connection.batches, connection.bytes_sent
+            start = time.perf_counter()
+            action()
+            seconds = time.perf_counter() - start
+            if visit == 0:
+                print(f"{name + ' (first)':<36} {connection.batches - batches:>3} msg "
+                      f"{connection.bytes_sent - sent:>8} B")
+            else:
+                traffic[name] = (connection.batches - batches, connection.bytes_sent - sent)
+                best[name] = min(seconds, best.get(name, seconds))
+    for name, (batches, sent) in traffic.items():
+        print(f"{name:<36} {batches:>3} msg {sent:>8} B {best[name] * 1e6:9.1f} us")
+    print(f"{'total per round':<36} {sum(b for b, _ in traffic.values()):>3} msg "
+          f"{sum(s for _, s in traffic.values()):>8} B {sum(best.values()) * 1e6:9.1f} us")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure UI update traffic per interaction.")
+    parser.add_argument("--app", help="path to a Tech-fest.py to measure (default: the current one)")
+    args = parser.parse_args(argv)
+    run(args.app)
+
+
+if __name__ == "__main__":
+    main()
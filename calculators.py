@@ -0,0 +1,72 @@
+"""Physics formulas used by the calculator, importable without the GUI."""
+import profiling
+
+COULOMB_CONSTANT = 8.99e9  # Coulomb's constant in N·m²/C²
+MU_0 = 1.2566370614359173e-6  # Permeability of free space in T·m/A
+
+@profiling.compute("calculate_capacitance")
+def calculate_capacitance(capacitances, configuration):
+    """Calculates total capacitance based on configuration."""
+    if not capacitances:
+        return "Error: At least one capacitance value is required."
+    for c in capacitances:
+        if c <= 0:
+            return "Error: All capacitance values must be positive."
+    if configuration == "Parallel":
+        return sum(capacitances)
+    elif configuration == "Series":
+        return 1.0 / sum(1.0 / c for c in capacitances)
+    return "Error: Configuration must be 'Series' or 'Parallel'."
+
+@profiling.compute("calculate_magnetic_field")
+def calculate_magnetic_field(current, distance):
+    """Calculates the magnetic field due to a straight current-carrying wire."""
+    mu_0 = MU_0
+    if not isinstance(current, (int, float)) or not isinstance(distance, (int, float)):
+        return "Error: Current and distance must be numeric."
+    if distance <= 0:
+        return "Error: Distance must be positive."
+    try:
+        return (mu_0 * current) / (2 * 3.141592653589793 * distance)
+    except Exception:
+        return "Error: Invalid current or distance."
+
+@profiling.compute("calculate_electric_force")
+def calculate_electric_force(charge1, charge2, distance):
+    """Calculates the electric force between two point charges."""
+    k = COULOMB_CONSTANT
+    if not isinstance(charge1, (int, float)) or not isinstance(charge2, (int, float)) or not isinstance(distance, (int, float)):
+        return "Error: Charges and distance must be numeric."
+    if distance <= 0:
+        return "Error: Distance must be positive."
+    try:
+        return k * abs(charge1 * charge2) / (distance ** 2)
+    except Exception:
+        return "Error: Invalid charges or distance."
+
+@profiling.compute("calculate_electric_field")
+def calculate_electric_field(charge, distance):
+    """Calculates the electric field due to a point charge."""
+    k = COULOMB_CONSTANT
+    if not isinstance(charge, (int, float)) or not isinstance(distance, (int, float)):
+        return "Error: Charge and distance must be numeric."
+    if distance <= 0:
+        return "Error: Distance must be positive."
+    try:
+        return k * charge / (distance ** 2)
+    except Exception:
+        return "Error: Invalid charge or distance."
+
+@profiling.compute("calculate_resistance")
+def calculate_resistance(resistances, configuration):
+    """Calculates total resistance based on configuration."""
+    if not resistances:
+        return "Error: At least one resistance value is required."
+    for r in resistances:
+        if r <= 0:
+            return "Error: All resistance values must be positive."
+    if configuration == "Parallel":
+        return 1.0 / sum(1.0 / r for r in resistances)
+    elif configuration == "Series":
+        return sum(resistances)
+    return "Error: Configuration must be 'Series' or 'Parallel'."
@@ -0,0 +1,226 @@
+"""Streaming batch mode: run the calculate_* functions over CSV or JSONL files.
+
+Every input row names its calculator in a `calculator` column and carries
+that calculator's arguments:
+
+    capacitance, resistance   values, configuration
+    electric_force            charge1, charge2, distance
+    electric_field            charge, distance
+    magnetic_field            current, distance
+
+In CSV, `values` is a comma-separated list inside one quoted field; in JSONL
+it may also be a JSON array. Values may carry SI prefixes (4.7k, 100n). A
+row may name a `values_file` (text or .npy, see value_parser.load_values)
+instead of listing its values. Each output row is the input row plus `result`
+and `error` columns, written in input order. Rows are read and written
+lazily and only a bounded number of chunks are in flight, so memory stays
+constant however large the file is.
+
+    python cli.py input.csv -o output.csv --workers 4
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from calculators import (calculate_capacitance, calculate_electric_field, calculate_electric_force,
+                         calculate_magnetic_field, calculate_resistance)
+import value_parser
+
+INVALID_INPUT = "Error: Invalid input. Please enter numeric values."
+NOT_FINITE = "Error: The result is not a finite number."
+
+CALCULATORS = {
+    "capacitance": (calculate_capacitance, ("values", "configuration")),
+    "resistance": (calculate_resistance, ("values", "configuration")),
+    "electric_force": (calculate_electric_force, ("charge1", "charge2", "distance")),
+    "electric_field": (calculate_electric_field, ("charge", "distance")),
+    "magnetic_field": (calculate_magnetic_field, ("current", "distance")),
+}
+
+
+def parse_values(values):
+    """Returns a list of floats from a JSON array or a separated string; SI prefixes are allowed."""
+    if isinstance(values, str):
+        return value_parser.parse_values(values).tolist()
+    if all(isinstance(v, (int, float)) for v in values):
+        return [float(v) for v in values]
+    parsed = value_parser.parse_values(" ".join(str(v) for v in values)).tolist()
+    if len(parsed) != len(values):
+        raise ValueError("Expected one value per array item")
+    return parsed
+
+
+def parse_arguments(calculator, row):
+    """Returns the positional arguments for one row, raising ValueError/KeyError on bad input."""
+    _, fields = CALCULATORS[calculator]
+    arguments = []
+    for field in fields:
+        if field == "values" and row.get("values_file") and not row.get("values"):
+            arguments.append(value_parser.load_values(row["values_file"]).tolist())
+            continue
+        value = row[field]
+        if field == "values":
+            arguments.append(parse_values(value))
+        elif field == "configuration":
+            arguments.append(value)
+        else:
+            arguments.append(float(value))
+    return arguments
+
+
+def evaluate_row(row):
+    """Runs the row's calculator, returning (result, error)."""
+    if isinstance(row, InvalidRow):
+        return None, row.error
+    calculator = row.get("calculator")
+    if calculator not in CALCULATORS:
+        return None, f"Error: Unknown calculator '{calculator}'."
+    try:
+        arguments = parse_arguments(calculator, row)
+    except (KeyError, TypeError, ValueError):
+        return None, INVALID_INPUT
+    except OSError:
+        return None, f"Error: Could not read values file '{row.get('values_file')}'."
+    return checked_result(CALCULATORS[calculator][0](*arguments))
+
+
+def checked_result(result):
+    """Returns (result, error) for a calculator's return value; NaN and infinities are errors, as JSON has neither."""
+    if isinstance(result, str):
+        return None, result
+    if not math.isfinite(result):
+        return None, NOT_FINITE
+    return result, None
+
+
+def evaluate_chunk(rows):
+    """Evaluates a list of rows; runs inside the worker processes."""
+    return [evaluate_row(row) for row in rows]
+
+
+def detect_format(path):
+    return "jsonl" if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+class InvalidRow(dict):
+    """A JSONL line that is not a JSON object; it is written back with its error instead of stopping the run."""
+
+    def __init__(self, line, text, error):
+        super().__init__(line=line, input=text)
+        self.error = error
+
+
+def _reject_constant(name):
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def read_rows(stream, fmt):
+    """Yields input rows as dicts, one at a time."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            # NaN and Infinity are accepted by json.loads but could not be written back as JSON
+            row = json.loads(line, parse_constant=_reject_constant)
+        except ValueError:
+            yield InvalidRow(number, line.rstrip("\r\n"), f"Error: Line {number} is not valid JSON.")
+            continue
+        if isinstance(row, dict):
+            yield row
+        else:
+            yield InvalidRow(number, line.rstrip("\r\n"), f"Error: Line {number} is not a JSON object.")
+
+
+class RowWriter:
+    """Writes result rows as CSV or JSONL."""
+
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.fmt = fmt
+        self.writer = None
+
+    def write(self, row, result, error):
+        row = dict(row, result=result, error=error)
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row, allow_nan=False) + "\n")
+            return
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.stream, fieldnames=list(row), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerow({k: "" if v is None else v for k, v in row.items()})
+
+
+def chunked(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def run(rows, writer, workers=None, chunk_size=10000):
+    """Evaluates rows chunk by chunk and writes results in input order.
+
+    With workers > 1 chunks go to a process pool; at most 2 * workers chunks
+    are pending at any time. Returns the number of rows processed.
+    """
+    count = 0
+    if not workers or workers <= 1:
+        for chunk in chunked(rows, chunk_size):
+            for row, (result, error) in zip(chunk, evaluate_chunk(chunk)):
+                writer.write(row, result, error)
+            count += len(chunk)
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunked(rows, chunk_size):
+            pending.append((chunk, pool.submit(evaluate_chunk, chunk)))
+            while len(pending) >= 2 * workers:
+                count += _drain(pending.popleft(), writer)
+        while pending:
+            count += _drain(pending.popleft(), writer)
+    return count
+
+
+def _drain(item, writer):
+    chunk, future = item
+    for row, (result, error) in zip(chunk, future.result()):
+        writer.write(row, result, error)
+    return len(chunk)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run physics calculations over a CSV or JSONL file.")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"))
+    parser.add_argument("--output-format", choices=("csv", "jsonl"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="rows per work unit (default: 10000)")
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or ("csv" if args.input == "-" else detect_format(args.input))
+    output_format = args.output_format or (input_format if args.output == "-" else detect_format(args.output))
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        count = run(read_rows(source, input_format), RowWriter(target, output_format),
+                    args.workers, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"Processed {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Electric field superposition of many point charges over large point sets.
+
+Uses the same constant and sign convention as calculate_electric_field: a
+positive charge gives a field pointing away from it with magnitude k*q/r².
+Points are processed in chunks so the charges × points intermediates stay
+within a memory budget, and chunks can be spread over a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from calculators import COULOMB_CONSTANT
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def as_positions(positions):
+    """Returns an (n, 3) float array, padding 2D coordinates with z = 0."""
+    positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+    if positions.shape[1] not in (2, 3):
+        raise ValueError("Positions must have 2 or 3 coordinates")
+    if positions.shape[1] == 2:
+        positions = np.column_stack((positions, np.zeros(len(positions))))
+    return positions
+
+
+def chunk_size(sources, max_chunk_bytes, temporaries=8):
+    """Returns how many points fit in one chunk given the number of sources.
+
+    temporaries is how many sources × points float64 arrays are alive at once.
+    In _field_chunk that is dx, dy, dz, r2 and inv_r plus up to three products
+    while r2 and the weights are formed.
+    """
+    return max(1, int(max_chunk_bytes // (temporaries * 8 * max(sources, 1))))
+
+
+def _field_chunk(charges, positions, points, potential):
+    dx = points[:, 0, None] - positions[None, :, 0]
+    dy = points[:, 1, None] - positions[None, :, 1]
+    dz = points[:, 2, None] - positions[None, :, 2]
+    r2 = dx * dx + dy * dy + dz * dz
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_r = 1.0 / np.sqrt(r2)
+        # A point sitting on a charge has no defined field, like distance <= 0 in the scalar formula.
+        inv_r[r2 == 0] = np.nan
+        kq = COULOMB_CONSTANT * charges
+        weight = inv_r * inv_r * inv_r * kq
+        ex = np.einsum("ij,ij->i", dx, weight)
+        ey = np.einsum("ij,ij->i", dy, weight)
+        ez = np.einsum("ij,ij->i", dz, weight)
+        v = inv_r @ kq if potential else None
+    return ex, ey, ez, v
+
+
+def electric_field(charges, positions, points, potential=False,
+                   max_chunk_bytes=DEFAULT_CHUNK_BYTES, processes=None):
+    """Calculates the E field of point charges at every point.
+
+    charges has shape (m,), positions and points have 2 or 3 columns.
+    Returns (Ex, Ey, Ez), or (Ex, Ey, Ez, V) when potential is True. Points
+    that coincide with a charge get NaN. Set processes to an int to split the
+    chunks across that many worker processes.
+    """
+    charges = np.asarray(charges, dtype=np.float64).ravel()
+    positions = as_positions(positions)
+    points = as_positions(points)
+    if len(charges) != len(positions):
+        raise ValueError("Expected one position per charge")
+
+    n = len(points)
+    ex, ey, ez = np.empty(n), np.empty(n), np.empty(n)
+    v = np.empty(n) if potential else None
+    step = chunk_size(len(charges), max_chunk_bytes)
+    spans = [(start, min(start + step, n)) for start in range(0, n, step)]
+
+    if processes and len(spans) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunks = pool.map(_field_chunk, repeat(charges), repeat(positions),
+                              (points[a:b] for a, b in spans), repeat(potential))
+            for (a, b), chunk in zip(spans, chunks):
+                ex[a:b], ey[a:b], ez[a:b] = chunk[:3]
+                if potential:
+                    v[a:b] = chunk[3]
+    else:
+        for a, b in spans:
+            chunk = _field_chunk(charges, positions, points[a:b], potential)
+            ex[a:b], ey[a:b], ez[a:b] = chunk[:3]
+            if potential:
+                v[a:b] = chunk[3]
+
+    return (ex, ey, ez, v) if potential else (ex, ey, ez)
+
+
+def electric_field_on_grid(charges, positions, axes, potential=False,
+                           max_chunk_bytes=DEFAULT_CHUNK_BYTES, processes=None):
+    """Calculates the E field on the grid spanned by 2 or 3 coordinate axes.
+
+    Returns arrays shaped like np.meshgrid(*axes, indexing="ij").
+    """
+    axes = [np.asarray(a, dtype=np.float64).ravel() for a in axes]
+    if len(axes) not in (2, 3):
+        raise ValueError("Expected 2 or 3 grid axes")
+    mesh = np.meshgrid(*axes, indexing="ij")
+    points = np.column_stack([m.ravel() for m in mesh])
+    result = electric_field(charges, positions, points, potential, max_chunk_bytes, processes)
+    return tuple(component.reshape(mesh[0].shape) for component in result)
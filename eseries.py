@@ -0,0 +1,186 @@
+"""Standard-value (E12/E24/E96) combination search for a target resistance or capacitance.
+
+    best = search(3300, "resistance", "E12", max_parts=4)
+
+For every standard part value, and every series or parallel pair of them,
+a sorted index is precomputed once per series and kind. A network of up to
+four parts is one or two of these halves joined in series or parallel. For
+each half the ideal partner value follows from the target, so the search is
+a vectorized binary search of the index (meet in the middle) rather than
+enumerating every combination. Totals are recomputed with calculate_resistance
+or calculate_capacitance, so they follow the same series/parallel rules.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+import profiling
+from calculators import calculate_capacitance, calculate_resistance
+
+E_SERIES = {
+    "E12": (10, 12, 15, 18, 22, 27, 33, 39, 47, 56, 68, 82),
+    "E24": (10, 11, 12, 13, 15, 16, 18, 20, 22, 24, 27, 30, 33, 36, 39, 43, 47, 51, 56, 62, 68, 75, 82, 91),
+    "E96": (100, 102, 105, 107, 110, 113, 115, 118, 121, 124, 127, 130, 133, 137, 140, 143, 147, 150, 154, 158,
+            162, 165, 169, 174, 178, 182, 187, 191, 196, 200, 205, 210, 215, 221, 226, 232, 237, 243, 249, 255,
+            261, 267, 274, 280, 287, 294, 301, 309, 316, 324, 332, 340, 348, 357, 365, 374, 383, 392, 402, 412,
+            422, 432, 442, 453, 464, 475, 487, 499, 511, 523, 536, 549, 562, 576, 590, 604, 619, 634, 649, 665,
+            681, 698, 715, 732, 750, 768, 787, 806, 825, 845, 866, 887, 909, 931, 953, 976),
+}
+
+# Decades of the first value in each series: 1 Ω to 10 MΩ and 1 pF to 1 mF
+DECADES = {"resistance": range(0, 7), "capacitance": range(-12, -3)}
+CALCULATE = {"resistance": calculate_resistance, "capacitance": calculate_capacitance}
+# Configuration whose total is a plain sum; the other one adds reciprocals
+SUM_CONFIGURATION = {"resistance": "Series", "capacitance": "Parallel"}
+MAX_PARTS = 4
+
+
+def standard_values(series, kind):
+    """Returns the sorted standard part values of one series over the decades for kind."""
+    values = []
+    digits = len(str(E_SERIES[series][0])) - 1
+    for decade in DECADES[kind]:
+        exponent = decade - digits
+        for base in E_SERIES[series]:
+            # Dividing by a power of ten rounds once, so 47 / 1e9 is the double nearest 47 nF
+            values.append(base * 10.0 ** exponent if exponent >= 0 else base / 10.0 ** -exponent)
+    return np.array(sorted(values))
+
+
+@lru_cache(maxsize=None)
+def half_index(series, kind):
+    """Returns the sorted reachable values with one or two parts, as (singles, pairs).
+
+    singles is a value array. pairs is (values, first part, second part, summed)
+    sorted by value, where summed marks the configuration that adds values.
+    """
+    singles = standard_values(series, kind)
+    first, second = np.triu_indices(singles.size)
+    a, b = singles[first], singles[second]
+    values = np.concatenate((a + b, a * b / (a + b)))
+    summed = np.concatenate((np.ones(first.size, dtype=bool), np.zeros(first.size, dtype=bool)))
+    order = np.argsort(values, kind="stable")
+    return singles, (values[order], np.tile(first, 2)[order], np.tile(second, 2)[order], summed[order])
+
+
+def _nearest(sorted_values, wanted):
+    """Index of the value in sorted_values nearest to each wanted value."""
+    position = np.clip(np.searchsorted(sorted_values, wanted), 1, sorted_values.size - 1)
+    below = sorted_values[position - 1]
+    above = sorted_values[position]
+    return np.where(np.abs(wanted - below) <= np.abs(above - wanted), position - 1, position)
+
+
+def _best_join(target, a_values, b_values, summed):
+    """Best (a index, b index) joining a value from a_values with one from b_values, or None."""
+    if not a_values.size or not b_values.size:
+        return None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wanted = target - a_values if summed else 1.0 / (1.0 / target - 1.0 / a_values)
+    possible = np.isfinite(wanted) & (wanted > 0)
+    if not possible.any():
+        return None
+    a_index = np.flatnonzero(possible)
+    b_index = _nearest(b_values, wanted[possible])
+    a, b = a_values[a_index], b_values[b_index]
+    totals = a + b if summed else a * b / (a + b)
+    best = int(np.argmin(np.abs(totals - target)))
+    return int(a_index[best]), int(b_index[best])
+
+
+def _pair_network(pairs, singles, index, kind):
+    values, first, second, summed = pairs
+    configuration = SUM_CONFIGURATION[kind] if summed[index] else _other(kind)
+    return configuration, [float(singles[first[index]]), float(singles[second[index]])]
+
+
+def _other(kind):
+    return "Parallel" if SUM_CONFIGURATION[kind] == "Series" else "Series"
+
+
+def network_value(network, kind):
+    """Evaluates a network (a value, or (configuration, [subnetworks])) with the calculate_* rules."""
+    if isinstance(network, float):
+        return network
+    configuration, parts = network
+    return CALCULATE[kind]([network_value(part, kind) for part in parts], configuration)
+
+
+def describe(network, unit):
+    """Formats a network as e.g. (4.7k + 2.2k) ∥ 10k Ω, with + for series and ∥ for parallel."""
+    def text(part, top):
+        if isinstance(part, float):
+            return format_value(part)
+        joined = (" + " if part[0] == "Series" else " ∥ ").join(text(p, False) for p in part[1])
+        return joined if top else f"({joined})"
+    return f"{text(network, True)} {unit}"
+
+
+def format_value(value):
+    """Formats a value with an SI prefix, e.g. 4700.0 as 4.7k."""
+    if not math.isfinite(value):
+        return f"{value:.4g}"
+    for prefix, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3), ("", 1.0), ("m", 1e-3), ("µ", 1e-6), ("n", 1e-9),
+                          ("p", 1e-12)):
+        if abs(value) >= scale * 0.9999999:
+            return f"{value / scale:.4g}{prefix}"
+    return f"{value:.4g}"
+
+
+@profiling.compute("search")
+def search(target, kind="resistance", series="E24", max_parts=MAX_PARTS):
+    """Returns the closest network for each part count from 1 to max_parts (at most 4).
+
+    Each entry is a dict with parts, value, error (relative) and network.
+    Returns an "Error: ..." string for invalid input, like the calculators.
+    """
+    if kind not in CALCULATE:
+        return "Error: Kind must be 'resistance' or 'capacitance'."
+    if series not in E_SERIES:
+        return f"Error: Series must be one of {', '.join(E_SERIES)}."
+    if not isinstance(target, (int, float)) or not math.isfinite(target) or target <= 0:
+        return "Error: Target must be positive and finite."
+    if not 1 <= max_parts <= MAX_PARTS:
+        return f"Error: Parts must be between 1 and {MAX_PARTS}."
+    target = float(target)
+    singles, pairs = half_index(series, kind)
+    pair_values = pairs[0]
+    pair_network = lambda i: _pair_network(pairs, singles, i, kind)
+
+    candidates = {1: [float(singles[_nearest(singles, np.array([target]))[0]])]}
+    if max_parts >= 2:
+        candidates[2] = [pair_network(int(_nearest(pair_values, np.array([target]))[0]))]
+    for summed in (True, False):
+        configuration = SUM_CONFIGURATION[kind] if summed else _other(kind)
+        if max_parts >= 3:
+            join = _best_join(target, singles, pair_values, summed)
+            if join:
+                candidates.setdefault(3, []).append((configuration, [float(singles[join[0]]), pair_network(join[1])]))
+        if max_parts >= 4:
+            # Both halves come from the same index, so only one of them needs a partner: the larger
+            # half of a summed total lies between half the target and the target, and the smaller
+            # half of a reciprocal total between the target and twice it. The 10% margin only drops
+            # joins that miss the target by more than a single part would.
+            if summed:
+                low, high = np.searchsorted(pair_values, [target / 2.2, target])
+            else:
+                low, high = np.searchsorted(pair_values, [target, 2.2 * target], side="right")
+            if low == high:
+                # Out of the reachable range no half fits; the pairs either side still give the closest network
+                low, high = max(low - 1, 0), min(high + 1, pair_values.size)
+            join = _best_join(target, pair_values[low:high], pair_values, summed)
+            if join:
+                candidates.setdefault(4, []).append((configuration,
+                                                     [pair_network(low + join[0]), pair_network(join[1])]))
+
+    results = []
+    for parts in sorted(candidates):
+        best = None
+        for network in candidates[parts]:
+            value = network_value(network, kind)
+            error = abs(value - target) / target
+            if best is None or error < best["error"]:
+                best = {"parts": parts, "value": value, "error": error, "network": network}
+        results.append(best)
+    return results
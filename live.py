@@ -0,0 +1,76 @@
+"""Debounced background recalculation for live results, independent of the GUI.
+
+    live = LiveCalculation(compute, apply, delay=0.3)
+    live.submit(text, configuration)   # on every keystroke
+
+compute(*args) runs on a single worker thread once the input has been quiet
+for `delay` seconds; apply(result) is called from that thread, and only if no
+newer input arrived while compute was running. Input that is superseded
+before its computation starts is never computed.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LiveCalculation:
+    """Runs the latest submitted input through compute() and hands current results to apply()."""
+
+    def __init__(self, compute, apply, delay=0.3):
+        self.compute = compute
+        self.apply = apply
+        self.delay = delay
+        self.generation = 0
+        self.timer = None
+        self.future = None
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def submit(self, *args):
+        """Schedules a computation of args, replacing any pending or running one."""
+        with self.lock:
+            self._supersede()
+            self.timer = threading.Timer(self.delay, self._start, (self.generation, args))
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel(self):
+        """Drops pending input and makes any running computation stale."""
+        with self.lock:
+            self._supersede()
+
+    def close(self):
+        """Cancels like cancel() and lets the worker thread exit; submit() starts a new one if needed."""
+        with self.lock:
+            self._supersede()
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+
+    def is_current(self, generation):
+        return generation == self.generation
+
+    def _supersede(self):
+        self.generation += 1
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+
+    def _start(self, generation, args):
+        with self.lock:
+            if not self.is_current(generation):
+                return
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live")
+            self.future = self.executor.submit(self._run, generation, args)
+
+    def _run(self, generation, args):
+        if not self.is_current(generation):
+            return
+        result = self.compute(*args)
+        # Holding the lock keeps a newer submit() from slipping in between the check and apply()
+        with self.lock:
+            if self.is_current(generation):
+                self.apply(result)
@@ -0,0 +1,91 @@
+"""Biot–Savart magnetic field of polyline wires and loops over large point sets.
+
+Each straight segment from r1 to r2 carrying current I contributes the
+closed-form field at p, with a = r1 - p and b = r2 - p:
+
+    B = μ₀I/(4π) · (a × b)(|a| + |b|) / (|a||b|(|a||b| + a·b))
+
+For a long straight wire this reduces to calculate_magnetic_field, μ₀I/(2πr).
+Points are processed in chunks to bound the segments × points temporaries
+and can be spread across a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from calculators import MU_0
+from electric_field import DEFAULT_CHUNK_BYTES, as_positions, chunk_size
+
+
+def wire_segments(wires, currents, closed=False):
+    """Flattens polylines into (starts, ends, segment currents).
+
+    wires is a list of (k, 2|3) vertex arrays, currents has one value per
+    wire and closed (a bool or one per wire) joins the last vertex back to
+    the first to form a loop. Current flows in vertex order.
+    """
+    currents = np.broadcast_to(np.asarray(currents, dtype=np.float64), (len(wires),))
+    closed = np.broadcast_to(np.asarray(closed, dtype=bool), (len(wires),))
+    starts, ends, segment_currents = [], [], []
+    for vertices, current, loop in zip(wires, currents, closed):
+        vertices = as_positions(vertices)
+        if loop:
+            vertices = np.vstack((vertices, vertices[:1]))
+        starts.append(vertices[:-1])
+        ends.append(vertices[1:])
+        segment_currents.append(np.full(len(vertices) - 1, current))
+    if not starts:
+        return np.empty((0, 3)), np.empty((0, 3)), np.empty(0)
+    return np.vstack(starts), np.vstack(ends), np.concatenate(segment_currents)
+
+
+def _field_chunk(starts, ends, currents, points):
+    ax, ay, az = (starts[None, :, k] - points[:, k, None] for k in range(3))
+    bx, by, bz = (ends[None, :, k] - points[:, k, None] for k in range(3))
+    cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+    a_norm = np.sqrt(ax * ax + ay * ay + az * az)
+    b_norm = np.sqrt(bx * bx + by * by + bz * bz)
+    norms = a_norm * b_norm
+    dot = ax * bx + ay * by + az * bz
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Next to a long segment a and b point almost opposite ways and |a||b| + a·b cancels;
+        # there it equals |a × b|² / (|a||b| - a·b), which does not.
+        cancelling = dot < 0
+        closeness = np.where(cancelling, (cx * cx + cy * cy + cz * cz) / (norms - dot), norms + dot)
+        denominator = norms * closeness
+        # Points on a segment have no defined field, like distance <= 0 in the scalar formula.
+        weight = MU_0 / (4 * np.pi) * currents * (a_norm + b_norm) / denominator
+    weight[denominator == 0] = np.nan
+    return (np.einsum("ij,ij->i", cx, weight),
+            np.einsum("ij,ij->i", cy, weight),
+            np.einsum("ij,ij->i", cz, weight))
+
+
+def magnetic_field(wires, currents, points, closed=False,
+                   max_chunk_bytes=DEFAULT_CHUNK_BYTES, processes=None):
+    """Calculates the B field of current-carrying wires at every point.
+
+    See wire_segments for the wire arguments; points has 2 or 3 columns.
+    Returns (Bx, By, Bz) in tesla. Points lying on a wire get NaN. Set
+    processes to an int to split the chunks across that many workers.
+    """
+    starts, ends, segment_currents = wire_segments(wires, currents, closed)
+    points = as_positions(points)
+    n = len(points)
+    bx, by, bz = np.empty(n), np.empty(n), np.empty(n)
+    # About twenty segments × points temporaries are alive at once.
+    step = chunk_size(len(starts), max_chunk_bytes, temporaries=20)
+    spans = [(start, min(start + step, n)) for start in range(0, n, step)]
+
+    if processes and len(spans) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunks = pool.map(_field_chunk, repeat(starts), repeat(ends), repeat(segment_currents),
+                              (points[a:b] for a, b in spans))
+            for (a, b), chunk in zip(spans, chunks):
+                bx[a:b], by[a:b], bz[a:b] = chunk
+    else:
+        for a, b in spans:
+            bx[a:b], by[a:b], bz[a:b] = _field_chunk(starts, ends, segment_currents, points[a:b])
+
+    return bx, by, bz
@@ -0,0 +1,209 @@
+"""Net Coulomb force on each of N point charges.
+
+The force on charge i is k*q_i*Σ q_j*(r_i - r_j)/|r_i - r_j|³, so like charges
+repel and each pair matches calculate_electric_force in magnitude. Two modes:
+
+* "exact": every pair, vectorized in row chunks, O(N²).
+* "barnes-hut": an octree built from Morton codes; a cell is replaced by its
+  positive and negative charge centres when size/distance < theta, O(N log N).
+
+Smaller theta is more accurate and slower; theta = 0 degenerates to exact.
+Barnes-Hut is approximate. On 10k random charges of both signs, per-charge
+relative errors compared with exact were about:
+
+    theta   median   99th percentile   worst
+    0.2     0.07%    0.4%              2%
+    0.5     1.2%     8%                60%
+    0.8     5%       36%               260%
+
+The worst cases are charges whose net force nearly cancels. Exact is the
+default; approximation has to be asked for with mode="barnes-hut" (or
+"auto", which switches to it from AUTO_THRESHOLD charges).
+"""
+import numpy as np
+
+from calculators import COULOMB_CONSTANT
+from electric_field import DEFAULT_CHUNK_BYTES, as_positions, chunk_size
+
+# Below this many charges the exact mode is faster, see benchmarks/nbody_crossover.py.
+AUTO_THRESHOLD = 2000
+
+_MORTON_BITS = 21
+
+
+def _check_distances(r2):
+    if np.any(r2 == 0):
+        raise ValueError("Distance must be positive.")
+
+
+def _exact_forces(charges, positions, max_chunk_bytes):
+    n = len(charges)
+    forces = np.empty((n, 3))
+    kq = COULOMB_CONSTANT * charges
+    # d counts three times, plus r2, inv_r and the products forming the weights
+    step = chunk_size(n, max_chunk_bytes, temporaries=10)
+    for a in range(0, n, step):
+        b = min(a + step, n)
+        d = positions[a:b, None, :] - positions[None, :, :]
+        r2 = np.einsum("ijk,ijk->ij", d, d)
+        rows = np.arange(b - a)
+        r2[rows, rows + a] = np.inf
+        _check_distances(r2)
+        inv_r = 1.0 / np.sqrt(r2)
+        weight = inv_r * inv_r * inv_r * kq
+        forces[a:b] = np.einsum("ijk,ij->ik", d, weight) * charges[a:b, None]
+    return forces
+
+
+def _morton_codes(positions):
+    lo = positions.min(axis=0)
+    extent = float((positions.max(axis=0) - lo).max()) or 1.0
+    scale = (2 ** _MORTON_BITS - 1) / extent
+    cells = ((positions - lo) * scale).astype(np.uint64)
+    codes = np.zeros(len(positions), dtype=np.uint64)
+    for bit in range(_MORTON_BITS):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(3 * bit + axis)
+    return codes, extent
+
+
+class _Octree:
+    """Flat octree over Morton-sorted charges; node arrays are indexed by node id."""
+
+    def __init__(self, charges, positions, leaf_size):
+        codes, extent = _morton_codes(positions)
+        self.order = np.argsort(codes, kind="stable")
+        codes = codes[self.order]
+        self.charges = charges[self.order]
+        self.positions = positions[self.order]
+        n = len(charges)
+
+        starts, ends, levels, first_child, child_end = [], [], [], [], []
+        node_count = 0
+        level_starts = np.array([0])
+        level_ends = np.array([n])
+        for level in range(_MORTON_BITS + 1):
+            count = level_ends - level_starts
+            split = (count > leaf_size) & (level < _MORTON_BITS)
+            starts.append(level_starts)
+            ends.append(level_ends)
+            levels.append(np.full(len(level_starts), level))
+            node_count += len(level_starts)
+            if not split.any():
+                first_child.append(np.full(len(level_starts), -1))
+                child_end.append(np.full(len(level_starts), -1))
+                break
+            # Children of the split nodes are the distinct Morton prefixes one level down.
+            members = np.concatenate([np.arange(a, b) for a, b in zip(level_starts[split], level_ends[split])])
+            keys = codes[members] >> np.uint64(3 * (_MORTON_BITS - level - 1))
+            boundary = np.flatnonzero(np.diff(keys)) + 1
+            boundary = np.union1d(boundary, np.searchsorted(members, level_starts[split]))
+            next_starts = members[boundary]
+            next_ends = np.append(members[boundary[1:] - 1] + 1, members[-1] + 1)
+            lo_child = np.searchsorted(next_starts, level_starts)
+            hi_child = np.searchsorted(next_starts, level_ends)
+            first_child.append(np.where(split, node_count + lo_child, -1))
+            child_end.append(np.where(split, node_count + hi_child, -1))
+            level_starts, level_ends = next_starts, next_ends
+
+        self.start = np.concatenate(starts)
+        self.end = np.concatenate(ends)
+        self.first_child = np.concatenate(first_child)
+        self.child_end = np.concatenate(child_end)
+        self.size = extent / 2.0 ** np.concatenate(levels)
+
+        # Positive and negative charge centres per node, so cancelling charges stay accurate.
+        self.centres = []
+        for part in (np.clip(self.charges, 0, None), np.clip(self.charges, None, 0)):
+            total = self._node_sums(part)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                centre = np.column_stack([self._node_sums(part * self.positions[:, axis]) / total
+                                          for axis in range(3)])
+            self.centres.append((total, np.nan_to_num(centre)))
+        counts = self.end - self.start
+        self.centroid = np.column_stack([self._node_sums(self.positions[:, axis]) / counts
+                                         for axis in range(3)])
+
+    def _node_sums(self, values):
+        prefix = np.concatenate(([0.0], np.cumsum(values)))
+        return prefix[self.end] - prefix[self.start]
+
+
+def _barnes_hut_forces(charges, positions, theta, leaf_size, max_chunk_bytes):
+    tree = _Octree(charges, positions, leaf_size)
+    n = len(charges)
+    field = np.zeros((n, 3))
+    targets_per_batch = chunk_size(1024, max_chunk_bytes)
+
+    def accumulate(targets, sources, q, first, last):
+        d = tree.positions[targets] - sources
+        r2 = np.einsum("ij,ij->i", d, d)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = COULOMB_CONSTANT * q / (r2 * np.sqrt(r2))
+        weight[q == 0] = 0.0
+        for axis in range(3):
+            field[first:last, axis] += np.bincount(targets - first, weights=d[:, axis] * weight,
+                                                   minlength=last - first)
+
+    for first in range(0, n, targets_per_batch):
+        last = min(first + targets_per_batch, n)
+        targets = np.arange(first, last)
+        nodes = np.zeros(len(targets), dtype=np.int64)
+        while len(targets):
+            d = tree.positions[targets] - tree.centroid[nodes]
+            dist = np.sqrt(np.einsum("ij,ij->i", d, d))
+            contains = (tree.start[nodes] <= targets) & (targets < tree.end[nodes])
+            accept = ~contains & (tree.size[nodes] < theta * dist)
+            leaf = ~accept & (tree.first_child[nodes] < 0)
+            opened = ~accept & ~leaf
+
+            t, m = targets[accept], nodes[accept]
+            for total, centre in tree.centres:
+                accumulate(t, centre[m], total[m], first, last)
+
+            t, m = targets[leaf], nodes[leaf]
+            counts = tree.end[m] - tree.start[m]
+            pair_targets = np.repeat(t, counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            pair_sources = np.repeat(tree.start[m], counts) + offsets
+            distinct = pair_targets != pair_sources
+            pair_targets, pair_sources = pair_targets[distinct], pair_sources[distinct]
+            delta = tree.positions[pair_targets] - tree.positions[pair_sources]
+            _check_distances(np.einsum("ij,ij->i", delta, delta))
+            accumulate(pair_targets, tree.positions[pair_sources], tree.charges[pair_sources], first, last)
+
+            t, m = targets[opened], nodes[opened]
+            counts = tree.child_end[m] - tree.first_child[m]
+            targets = np.repeat(t, counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            nodes = np.repeat(tree.first_child[m], counts) + offsets
+
+    forces = np.empty((n, 3))
+    forces[tree.order] = field * tree.charges[:, None]
+    return forces
+
+
+def coulomb_forces(charges, positions, mode="exact", theta=0.5, leaf_size=32,
+                   max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Calculates the net electric force vector on every charge.
+
+    positions has 2 or 3 columns. mode is "exact" (the default), "barnes-hut"
+    or "auto", which uses Barnes-Hut from AUTO_THRESHOLD charges; see the
+    module docstring for the error to expect at a given theta. Returns
+    (Fx, Fy, Fz). Raises ValueError if two charges share a position.
+    """
+    charges = np.asarray(charges, dtype=np.float64).ravel()
+    positions = as_positions(positions)
+    if len(charges) != len(positions):
+        raise ValueError("Expected one position per charge")
+    if mode == "auto":
+        mode = "exact" if len(charges) < AUTO_THRESHOLD else "barnes-hut"
+    if mode == "exact":
+        forces = _exact_forces(charges, positions, max_chunk_bytes)
+    elif mode == "barnes-hut":
+        if not 0 <= theta <= 1:
+            raise ValueError("theta must be between 0 and 1")
+        forces = _barnes_hut_forces(charges, positions, theta, leaf_size, max_chunk_bytes)
+    else:
+        raise ValueError("mode must be 'exact', 'barnes-hut' or 'auto'")
+    return forces[:, 0], forces[:, 1], forces[:, 2]
@@ -0,0 +1,146 @@
+"""Multi-process series/parallel totals for very long value lists.
+
+The values are copied once into shared memory and cut into fixed blocks of
+BLOCK_SIZE values. Worker processes sum whole blocks (NumPy's pairwise
+summation, taking reciprocals first where needed) and the block sums are
+combined with math.fsum, which rounds the exact total once. Block boundaries
+do not depend on the worker count and fsum does not depend on the order of
+its inputs, so the result is bitwise identical for any number of workers.
+
+    calculate_resistance_parallel(values, "Parallel", workers=8)
+
+Copying into shared memory costs about as much as one pass over the values;
+wrap them in SharedValues to pay it once for several reductions.
+"""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import profiling
+
+BLOCK_SIZE = 2 ** 20
+MIN_PARALLEL_SIZE = 4 * BLOCK_SIZE
+
+_pools = {}
+
+
+def _block_sums(values, first_block, last_block, reciprocal, block_size):
+    """Returns (sums of blocks first_block..last_block - 1, whether any value is <= 0)."""
+    sums = []
+    non_positive = False
+    with np.errstate(divide="ignore"):
+        for block in range(first_block, last_block):
+            chunk = values[block * block_size:(block + 1) * block_size]
+            # Not chunk.min(): a NaN in the block makes it NaN and hides any negative value
+            non_positive = non_positive or bool(np.any(chunk <= 0))
+            sums.append(float(np.add.reduce(np.divide(1.0, chunk) if reciprocal else chunk)))
+    return sums, non_positive
+
+
+def _shared_block_sums(name, size, first_block, last_block, reciprocal, block_size):
+    """Runs in a worker: attaches to the shared values and sums a range of blocks."""
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        return _block_sums(np.ndarray(size, dtype=np.float64, buffer=shared.buf),
+                           first_block, last_block, reciprocal, block_size)
+    finally:
+        shared.close()
+
+
+class SharedValues:
+    """A float64 copy of values in shared memory, reusable across reductions."""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.size = values.size
+        self.shared = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self.array = np.ndarray(self.size, dtype=np.float64, buffer=self.shared.buf)
+        self.array[:] = values
+
+    def close(self):
+        del self.array
+        self.shared.close()
+        self.shared.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def pool(workers=None):
+    """Returns a process pool that is kept for later calls with the same worker count."""
+    workers = workers or os.cpu_count()
+    if workers not in _pools:
+        # Forking the multithreaded GUI process could copy a lock some other thread holds
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"))
+    return _pools[workers]
+
+
+def reproducible_sum(values, reciprocal=False, workers=None, block_size=BLOCK_SIZE):
+    """Returns (sum of values or of their reciprocals, whether any value is <= 0); independent of `workers`.
+
+    values may be a SharedValues. workers=1, or fewer than MIN_PARALLEL_SIZE
+    values, sums in this process.
+    """
+    if not isinstance(values, SharedValues):
+        values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+    blocks = -(-values.size // block_size)
+    workers = min(workers or os.cpu_count(), blocks)
+    if workers <= 1 or values.size < MIN_PARALLEL_SIZE:
+        array = values.array if isinstance(values, SharedValues) else values
+        sums, non_positive = _block_sums(array, 0, blocks, reciprocal, block_size)
+        return math.fsum(sums), non_positive
+
+    shared = values if isinstance(values, SharedValues) else SharedValues(values)
+    try:
+        # A few ranges per worker, so uneven progress still keeps every worker busy
+        bounds = np.linspace(0, blocks, min(blocks, 4 * workers) + 1).astype(int)
+        futures = [pool(workers).submit(_shared_block_sums, shared.shared.name, shared.size, start, stop,
+                                        reciprocal, block_size)
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        sums, non_positive = [], False
+        for future in futures:
+            block_sums, block_non_positive = future.result()
+            sums.extend(block_sums)
+            non_positive = non_positive or block_non_positive
+    finally:
+        if shared is not values:
+            shared.close()
+    return math.fsum(sums), non_positive
+
+
+def _calculate(values, configuration, reciprocal_configuration, name, workers):
+    if not isinstance(values, SharedValues):
+        values = np.asarray(values, dtype=np.float64)
+    if not values.size:
+        return f"Error: At least one {name} value is required."
+    if configuration not in ("Series", "Parallel"):
+        array = values.array if isinstance(values, SharedValues) else values
+        total, non_positive = None, bool(np.any(array <= 0))
+    else:
+        reciprocal = configuration == reciprocal_configuration
+        total, non_positive = reproducible_sum(values, reciprocal, workers)
+    # Same precedence of errors as the scalar functions
+    if non_positive:
+        return f"Error: All {name} values must be positive."
+    if total is None:
+        return "Error: Configuration must be 'Series' or 'Parallel'."
+    return 1.0 / total if reciprocal else total
+
+
+@profiling.compute("calculate_capacitance_parallel")
+def calculate_capacitance_parallel(values, configuration, workers=None):
+    """Calculates total capacitance like calculate_capacitance, summing across worker processes."""
+    return _calculate(values, configuration, "Series", "capacitance", workers)
+
+
+@profiling.compute("calculate_resistance_parallel")
+def calculate_resistance_parallel(values, configuration, workers=None):
+    """Calculates total resistance like calculate_resistance, summing across worker processes."""
+    return _calculate(values, configuration, "Parallel", "resistance", workers)
@@ -0,0 +1,222 @@
+"""Optional latency profiling for the UI handlers and calculate_* functions.
+
+Profiling is switched on by setting PHYSICS_CALC_PROFILE=1 before the app
+starts. When it is off, the decorators return the function they are given,
+so nothing is added to any call.
+
+    @profiling.handler("on_calculate_capacitance")   # total, parse, compute, render
+    @profiling.compute("calculate_capacitance")      # compute
+
+Inside a handler, time spent in compute-wrapped functions counts as compute
+and time in the wrapped page.update as render; the rest of the handler is
+parse. Latencies go into fixed log-spaced histograms. snapshot(), to_json()
+and to_prometheus() export them, and start_exporter() writes one of them to
+a file periodically (PHYSICS_CALC_PROFILE_EXPORT names the file; a .prom
+extension selects the Prometheus text format).
+"""
+import bisect
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+
+ENABLED = os.environ.get("PHYSICS_CALC_PROFILE", "") not in ("", "0")
+EXPORT_PATH = os.environ.get("PHYSICS_CALC_PROFILE_EXPORT")
+EXPORT_INTERVAL = 10.0
+
+# Upper bounds in seconds: 1-2-5 steps from 1 µs to 10 s, then an overflow bucket
+BOUNDS = tuple(float(f"{m}e{e}") for e in range(-6, 1) for m in (1, 2, 5)) + (10.0,)
+
+_histograms = {}
+_lock = threading.Lock()
+_local = threading.local()
+_exporter = None
+
+
+class LatencyHistogram:
+    """Counts, sum and maximum of latencies in fixed log-spaced buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (the maximum for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum_seconds": self.sum,
+            "mean_seconds": self.sum / self.count if self.count else 0.0,
+            "max_seconds": self.max,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "p99_seconds": self.percentile(99),
+            "buckets": dict(zip([str(b) for b in BOUNDS] + ["+Inf"], self.counts)),
+        }
+
+
+def record(name, phase, seconds):
+    with _lock:
+        histogram = _histograms.get((name, phase))
+        if histogram is None:
+            histogram = _histograms[(name, phase)] = LatencyHistogram()
+        histogram.record(seconds)
+
+
+def _attribute(phase, seconds):
+    """Adds time to the handler running on this thread, if any."""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1][phase] += seconds
+
+
+def handler(name):
+    """Records total, parse, compute and render time of an event handler."""
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            stack = _local.__dict__.setdefault("stack", [])
+            stack.append({"compute": 0.0, "render": 0.0})
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - start
+                phases = stack.pop()
+                record(name, "total", total)
+                record(name, "compute", phases["compute"])
+                record(name, "render", phases["render"])
+                record(name, "parse", max(total - phases["compute"] - phases["render"], 0.0))
+                # A handler called from another one is part of the caller's time
+                _attribute("compute", phases["compute"])
+                _attribute("render", phases["render"])
+        return wrapper
+    return decorate
+
+
+def _timed(name, phase, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _local.depth = depth
+            record(name, phase, seconds)
+            # Only the outermost timed call counts, so a cached call and the function it wraps are not added twice
+            if depth == 0:
+                _attribute(phase, seconds)
+    return wrapper
+
+
+def compute(name):
+    """Records the time of a calculation and counts it as the running handler's compute time."""
+    def decorate(function):
+        return _timed(name, "compute", function) if ENABLED else function
+    return decorate
+
+
+def render(update):
+    """Wraps page.update so its time counts as the running handler's render time."""
+    return _timed("page.update", "render", update) if ENABLED else update
+
+
+def snapshot():
+    """Returns {name: {phase: histogram dict}} for everything recorded so far."""
+    with _lock:
+        result = {}
+        for (name, phase), histogram in sorted(_histograms.items()):
+            result.setdefault(name, {})[phase] = histogram.as_dict()
+        return result
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def to_json():
+    return json.dumps({"created": time.time(), "latency": snapshot()}, indent=2)
+
+
+def to_prometheus():
+    """Returns the histograms in the Prometheus text exposition format."""
+    lines = ["# HELP physics_calc_latency_seconds Latency of UI handlers and calculations.",
+             "# TYPE physics_calc_latency_seconds histogram"]
+    with _lock:
+        for (name, phase), histogram in sorted(_histograms.items()):
+            labels = f'name="{name}",phase="{phase}"'
+            cumulative = 0
+            for bound, count in zip([repr(b) for b in BOUNDS] + ["+Inf"], histogram.counts):
+                cumulative += count
+                lines.append(f'physics_calc_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"physics_calc_latency_seconds_sum{{{labels}}} {histogram.sum!r}")
+            lines.append(f"physics_calc_latency_seconds_count{{{labels}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def export(path):
+    """Writes to_prometheus() (for a .prom path) or to_json() to path, replacing it atomically."""
+    text = to_prometheus() if path.endswith(".prom") else to_json()
+    directory, name = os.path.split(os.path.abspath(path))
+    # A temporary file of its own, so concurrent exports never replace each other's half-written file
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, prefix=f".{name}.", suffix=".tmp",
+                                     delete=False) as f:
+        f.write(text)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+def start_exporter(path=None, interval=EXPORT_INTERVAL):
+    """Exports to path every `interval` seconds on a daemon thread, once per process.
+
+    Returns the exporter thread (the running one if it was already started), or None.
+    """
+    global _exporter
+    path = path or EXPORT_PATH
+    if not ENABLED or not path:
+        return None
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                export(path)
+            except OSError:
+                pass
+
+    with _lock:
+        if _exporter is None:
+            _exporter = threading.Thread(target=run, name="profiling-export", daemon=True)
+            _exporter.start()
+        return _exporter
@@ -0,0 +1,124 @@
+"""Bounded LRU cache in front of calculate_capacitance and calculate_resistance.
+
+Entries are keyed on the configuration and the multiset of component values
+(each distinct value with its count), so the same parts entered in any order
+hit the same entry. Counting is O(n) like the reduction itself, where sorting
+the values would cost more than the reduction it saves. Misses are computed
+on the values in sorted order, which keeps the cached total independent of
+the order the parts were first entered in; only the distinct values are
+sorted. The order each list was last entered in is also remembered, so exact
+repeats skip the counting.
+
+Lists longer than MAX_CACHED_VALUES are passed straight to the function:
+copying and hashing them costs more than the reduction itself, and keeping
+them would let a few long lists hold most of the memory.
+"""
+import threading
+from collections import Counter, OrderedDict
+
+import profiling
+from calculators import calculate_capacitance, calculate_resistance
+
+MAX_CACHED_VALUES = 10_000
+
+
+class ReductionCache:
+    """LRU cache for one series/parallel reduction function."""
+
+    def __init__(self, function, maxsize=1024, max_values=MAX_CACHED_VALUES):
+        self.function = function
+        self.maxsize = maxsize
+        self.max_values = max_values
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # The UI calls in from event handlers and from the live recalculation worker
+        self.lock = threading.Lock()
+
+    @profiling.compute("reduction_cache")
+    def __call__(self, values, configuration):
+        try:
+            if len(values) > self.max_values:
+                return self.function(values, configuration)
+            entered = tuple(values)
+            entered_key = (configuration, len(entered), hash(entered))
+        except TypeError:
+            return self.function(values, configuration)
+        # The hash of a long tuple is the expensive part, so it is computed once and
+        # the tuple is kept in the entry to rule out collisions.
+        with self.lock:
+            entry = self._lookup(entered_key, entered)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+        # A frozenset keeps its hash once computed, so it can be part of the key itself
+        counts = frozenset(Counter(entered).items())
+        counts_key = (configuration, counts)
+        with self.lock:
+            entry = self._lookup(counts_key, counts)
+            if entry is not None:
+                self.hits += 1
+                result = entry[1]
+        if entry is None:
+            # Computed without the lock, so a long calculation does not hold up other callers
+            ordered = [value for value, count in sorted(counts) for _ in range(count)]
+            result = self.function(ordered, configuration)
+            with self.lock:
+                self.misses += 1
+                entry = self._store(counts_key, counts, result)
+        with self.lock:
+            if entry is not None:
+                # Remember only the latest entered order per list, so exact repeats skip the counting.
+                if entry[2] is not None:
+                    self.entries.pop(entry[2], None)
+                entry[2] = entered_key
+                self._store(entered_key, entered, result)
+        return result
+
+    def _lookup(self, key, values):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != values:
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, values, result):
+        if self.maxsize <= 0:
+            return None
+        entry = self.entries[key] = [values, result, None]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def resize(self, maxsize):
+        """Changes the capacity, evicting least recently used entries if needed."""
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.entries) > max(maxsize, 0):
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Returns hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "max_values": self.max_values,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+cached_calculate_capacitance = ReductionCache(calculate_capacitance)
+cached_calculate_resistance = ReductionCache(calculate_resistance)
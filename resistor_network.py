@@ -0,0 +1,132 @@
+"""Resistor networks of arbitrary topology, solved by sparse nodal analysis.
+
+The network is given as an edge list of (node_a, node_b, R). Its conductance
+(Laplacian) matrix is factorized once with one node per connected component
+held at 0 V, and every query afterwards is a pair of triangular solves.
+Changing a few resistor values is folded in with a Woodbury low-rank
+correction instead of refactorizing, until enough edges have changed that
+refactorizing is cheaper.
+"""
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+
+class ResistorNetwork:
+    """Sparse nodal-analysis solver for a resistor network."""
+
+    def __init__(self, edges, refactor_after=32):
+        node_a, node_b, resistances = zip(*edges) if edges else ((), (), ())
+        resistances = np.asarray(resistances, dtype=np.float64)
+        if not resistances.size:
+            raise ValueError("At least one resistance value is required.")
+        if np.any(~(resistances > 0)):
+            raise ValueError("All resistance values must be positive.")
+        labels = np.concatenate((np.asarray(node_a), np.asarray(node_b)))
+        self.nodes, index = np.unique(labels, return_inverse=True)
+        self.node_a = index[:len(resistances)]
+        self.node_b = index[len(resistances):]
+        self.resistances = resistances
+        self.refactor_after = refactor_after
+        self._factorize()
+
+    def index(self, node):
+        """Returns the matrix index of a node label."""
+        position = np.searchsorted(self.nodes, node)
+        if position >= len(self.nodes) or self.nodes[position] != node:
+            raise KeyError(node)
+        return int(position)
+
+    def _laplacian(self, conductances):
+        n = len(self.nodes)
+        rows = np.concatenate((self.node_a, self.node_b, self.node_a, self.node_b))
+        cols = np.concatenate((self.node_a, self.node_b, self.node_b, self.node_a))
+        values = np.concatenate((conductances, conductances, -conductances, -conductances))
+        return coo_matrix((values, (rows, cols)), shape=(n, n)).tocsc()
+
+    def _factorize(self):
+        self._conductances = 1.0 / self.resistances
+        laplacian = self._laplacian(self._conductances)
+        _, self._component = connected_components(laplacian, directed=False)
+        # Ground the first node of every component so the reduced matrix is non-singular.
+        grounded = np.zeros(len(self.nodes), dtype=bool)
+        grounded[np.unique(self._component, return_index=True)[1]] = True
+        self._free = np.flatnonzero(~grounded)
+        self._reduced = np.full(len(self.nodes), -1)
+        self._reduced[self._free] = np.arange(len(self._free))
+        self._lu = splu(csc_matrix(laplacian[self._free][:, self._free]), permc_spec="MMD_AT_PLUS_A") \
+            if len(self._free) else None
+        self._changed = np.zeros(0, dtype=np.int64)
+        self._correction = None
+
+    def update_resistances(self, changes):
+        """Changes resistor values in place; changes maps edge index to new R."""
+        edges = np.fromiter(changes.keys(), dtype=np.int64, count=len(changes))
+        values = np.fromiter(changes.values(), dtype=np.float64, count=len(changes))
+        if np.any(~(values > 0)):
+            raise ValueError("All resistance values must be positive.")
+        self.resistances[edges] = values
+        changed = np.union1d(self._changed, edges)
+        delta = 1.0 / self.resistances[changed] - self._conductances[changed]
+        changed, delta = changed[delta != 0], delta[delta != 0]
+        if len(changed) > self.refactor_after:
+            self._factorize()
+            return
+        self._changed = changed
+        if not len(changed):
+            self._correction = None
+            return
+        # Woodbury: (L + U diag(delta) Uᵀ)⁻¹ = L⁻¹ - Z (diag(1/delta) + Uᵀ Z)⁻¹ Zᵀ with Z = L⁻¹ U.
+        u = np.zeros((len(self._free), len(changed)))
+        columns = np.arange(len(changed))
+        for nodes, sign in ((self.node_a[changed], 1.0), (self.node_b[changed], -1.0)):
+            rows = self._reduced[nodes]
+            keep = rows >= 0
+            u[rows[keep], columns[keep]] += sign
+        z = self._lu.solve(u)
+        inner = np.diag(1.0 / delta) + u.T @ z
+        self._correction = (u, z, inner)
+
+    def _solve(self, injection):
+        voltages = np.zeros(len(self.nodes))
+        if self._lu is None:
+            return voltages
+        x = self._lu.solve(injection[self._free])
+        if self._correction is not None:
+            u, z, inner = self._correction
+            x -= z @ np.linalg.solve(inner, u.T @ x)
+        voltages[self._free] = x
+        return voltages
+
+    def _unit_solve(self, a, b):
+        i, j = self.index(a), self.index(b)
+        if i == j:
+            raise ValueError("Nodes must be different.")
+        if self._component[i] != self._component[j]:
+            raise ValueError("Nodes are not connected.")
+        injection = np.zeros(len(self.nodes))
+        injection[i], injection[j] = 1.0, -1.0
+        voltages = self._solve(injection)
+        return voltages, voltages[i] - voltages[j], j
+
+    def equivalent_resistance(self, a, b):
+        """Calculates the equivalent resistance between nodes a and b."""
+        return float(self._unit_solve(a, b)[1])
+
+    def solve(self, source, sink, voltage=None, current=None):
+        """Applies a voltage or current source between two nodes.
+
+        Pass exactly one of voltage (V) or current (A). Returns
+        (node voltages, branch currents); voltages follow self.nodes with the
+        sink at 0 V, currents follow the edge order and flow from node_a to
+        node_b. Nodes outside the source's component are left at 0 V.
+        """
+        if (voltage is None) == (current is None):
+            raise ValueError("Specify exactly one of voltage or current.")
+        voltages, resistance, j = self._unit_solve(source, sink)
+        scale = current if current is not None else voltage / resistance
+        voltages = (voltages - voltages[j]) * scale
+        voltages[self._component != self._component[j]] = 0.0
+        currents = (voltages[self.node_a] - voltages[self.node_b]) / self.resistances
+        return voltages, currents
@@ -0,0 +1,216 @@
+"""Local HTTP/JSON calculation service built on asyncio, no GUI and no network access needed.
+
+Endpoints:
+
+    POST /calculate/<calculator>   body: the calculator's arguments, see cli.CALCULATORS
+    POST /bulk                     body: {"rows": [{"calculator": ..., ...}, ...]}
+    GET  /stats                    per-endpoint latency and throughput counters
+
+Single requests for the same calculator that arrive within max_delay of each
+other are coalesced into one micro-batch; capacitance and resistance batches
+are evaluated with the vectorized batch module.
+
+    python service.py --port 8765
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+
+from batch import ERROR_MESSAGES, OK, calculate_capacitance_batch, calculate_resistance_batch
+from cli import CALCULATORS, INVALID_INPUT, checked_result, evaluate_chunk, parse_arguments
+
+BATCH_FUNCTIONS = {
+    "capacitance": calculate_capacitance_batch,
+    "resistance": calculate_resistance_batch,
+}
+
+# Rows may name a local values_file in the command line tool, but not over HTTP
+FILES_NOT_ALLOWED = "Error: values_file is only supported by the command line tool."
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+def evaluate_batch(calculator, rows):
+    """Evaluates rows that all use one calculator, returning (result, error) pairs."""
+    if calculator not in BATCH_FUNCTIONS:
+        return evaluate_chunk(rows)
+    outcomes = [None] * len(rows)
+    parsed, positions = [], []
+    for position, row in enumerate(rows):
+        try:
+            parsed.append(parse_arguments(calculator, row))
+            positions.append(position)
+        except (KeyError, TypeError, ValueError):
+            outcomes[position] = (None, INVALID_INPUT)
+    if parsed:
+        values = [arguments[0] for arguments in parsed]
+        configurations = [str(arguments[1]) for arguments in parsed]
+        totals, errors = BATCH_FUNCTIONS[calculator](values, configurations)
+        messages = ERROR_MESSAGES[calculator]
+        for position, total, error in zip(positions, totals.tolist(), errors.tolist()):
+            outcomes[position] = checked_result(total) if error == OK else (None, messages[error])
+    return outcomes
+
+
+class EndpointStats:
+    """Request, error and latency counters for one endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.batches = 0
+        self.batched_rows = 0
+
+    def record(self, seconds, error):
+        self.requests += 1
+        self.errors += bool(error)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self, uptime):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "mean_latency_ms": 1000 * self.total_seconds / self.requests if self.requests else 0.0,
+            "max_latency_ms": 1000 * self.max_seconds,
+            "requests_per_second": self.requests / uptime if uptime else 0.0,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_rows / self.batches if self.batches else 0.0,
+        }
+
+
+class MicroBatcher:
+    """Collects rows for one calculator and evaluates them together."""
+
+    def __init__(self, calculator, stats, max_delay, max_batch):
+        self.calculator = calculator
+        self.stats = stats
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.pending = []
+        self.flush_handle = None
+
+    def submit(self, row):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((row, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        self.stats.batches += 1
+        self.stats.batched_rows += len(pending)
+        outcomes = evaluate_batch(self.calculator, [row for row, _ in pending])
+        for (_, future), outcome in zip(pending, outcomes):
+            if not future.done():
+                future.set_result(outcome)
+
+
+class CalculationService:
+    """HTTP/1.1 keep-alive server exposing the calculators."""
+
+    def __init__(self, max_delay=0.002, max_batch=256):
+        self.stats = defaultdict(EndpointStats)
+        self.batchers = {name: MicroBatcher(name, self.stats[f"/calculate/{name}"], max_delay, max_batch)
+                         for name in CALCULATORS}
+        self.endpoints = {"/stats", "/bulk", *(f"/calculate/{name}" for name in CALCULATORS)}
+        self.started = time.monotonic()
+
+    async def handle(self, method, path, body):
+        """Returns (status, payload) for one request."""
+        if path == "/stats":
+            uptime = time.monotonic() - self.started
+            return 200, {"uptime_seconds": uptime,
+                         "endpoints": {name: s.as_dict(uptime) for name, s in sorted(self.stats.items())}}
+        if method != "POST":
+            return 405, {"error": "Error: Use POST."}
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"error": "Error: Body must be JSON."}
+        if path == "/bulk":
+            rows = payload.get("rows") if isinstance(payload, dict) else None
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                return 400, {"error": "Error: Body must be {\"rows\": [...]}."}
+            if any("values_file" in row for row in rows):
+                return 400, {"error": FILES_NOT_ALLOWED}
+            outcomes = evaluate_chunk(rows)
+            return 200, {"results": [{"result": r, "error": e} for r, e in outcomes]}
+        name = path[len("/calculate/"):] if path.startswith("/calculate/") else None
+        if name not in self.batchers:
+            return 404, {"error": f"Error: Unknown endpoint '{path}'."}
+        if not isinstance(payload, dict):
+            return 400, {"error": INVALID_INPUT}
+        if "values_file" in payload:
+            return 400, {"error": FILES_NOT_ALLOWED}
+        result, error = await self.batchers[name].submit(dict(payload, calculator=name))
+        return 200, {"result": result, "error": error}
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                path = path.split("?", 1)[0]
+                start = time.perf_counter()
+                status, payload = await self.handle(method, path, body)
+                # Any other path counts as "unknown", so clients cannot add entries to the stats
+                endpoint = path if path in self.endpoints else "unknown"
+                self.stats[endpoint].record(time.perf_counter() - start, status != 200 or payload.get("error"))
+
+                data = json.dumps(payload, allow_nan=False).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.serve_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the physics calculators over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="micro-batch window (default: 2 ms)")
+    parser.add_argument("--max-batch", type=int, default=256, help="largest micro-batch (default: 256)")
+    args = parser.parse_args(argv)
+    service = CalculationService(args.max_delay_ms / 1000, args.max_batch)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Client and load generator for the local calculation service in service.py.
+
+    python service_client.py --connections 64 --requests 200 --calculator resistance
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import random
+import statistics
+import time
+
+
+class ServiceClient:
+    """Blocking keep-alive client for one service connection."""
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.connection = http.client.HTTPConnection(host, port)
+
+    def _post(self, path, payload):
+        self.connection.request("POST", path, json.dumps(payload), {"Content-Type": "application/json"})
+        return json.loads(self.connection.getresponse().read())
+
+    def calculate(self, calculator, **arguments):
+        """Returns (result, error) for one calculation."""
+        response = self._post(f"/calculate/{calculator}", arguments)
+        return response.get("result"), response.get("error")
+
+    def bulk(self, rows):
+        """Returns a list of (result, error) for rows that each name their calculator."""
+        return [(r["result"], r["error"]) for r in self._post("/bulk", {"rows": rows})["results"]]
+
+    def stats(self):
+        self.connection.request("GET", "/stats")
+        return json.loads(self.connection.getresponse().read())
+
+    def close(self):
+        self.connection.close()
+
+
+def sample_arguments(calculator, rng):
+    """Returns a random valid argument dict for a calculator."""
+    if calculator in ("capacitance", "resistance"):
+        return {"values": [rng.uniform(1, 1000) for _ in range(rng.randint(1, 8))],
+                "configuration": rng.choice(("Series", "Parallel"))}
+    if calculator == "electric_force":
+        return {"charge1": rng.uniform(-1e-6, 1e-6), "charge2": rng.uniform(-1e-6, 1e-6),
+                "distance": rng.uniform(0.01, 1)}
+    if calculator == "electric_field":
+        return {"charge": rng.uniform(-1e-6, 1e-6), "distance": rng.uniform(0.01, 1)}
+    return {"current": rng.uniform(0, 10), "distance": rng.uniform(0.01, 1)}
+
+
+async def _connection_worker(host, port, calculator, count, latencies, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            body = json.dumps(sample_arguments(calculator, rng)).encode()
+            start = time.perf_counter()
+            writer.write(f"POST /calculate/{calculator} HTTP/1.1\r\nHost: {host}\r\n"
+                         f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            length = 0
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, calculator, connections, requests):
+    """Runs `connections` concurrent keep-alive connections, each sending `requests` calls."""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection_worker(host, port, calculator, requests, latencies, seed)
+                           for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": 1000 * statistics.median(latencies),
+        "p99_ms": 1000 * latencies[int(0.99 * (len(latencies) - 1))],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the local calculation service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--calculator", default="resistance")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requests per connection")
+    args = parser.parse_args(argv)
+    report = asyncio.run(load_test(args.host, args.port, args.calculator, args.connections, args.requests))
+    print(json.dumps(report, indent=2))
+    client = ServiceClient(args.host, args.port)
+    print(json.dumps(client.stats()["endpoints"].get(f"/calculate/{args.calculator}"), indent=2))
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Vectorized parameter sweeps of the scalar formulas, with downsampling for charts.
+
+    distances, field = sweep("magnetic_field", {"current": 3.0}, 0.01, 1.0, 10 ** 6)
+    x, y = downsample(distances, field, 1000)
+
+Each sweep evaluates the same expression as its calculate_* function over a
+linear or logarithmic range of distances, with NaN where the scalar function
+would return an error. downsample() reduces a curve to a chart-sized number
+of points with LTTB (largest triangle three buckets) or per-bucket min/max.
+"""
+import numpy as np
+
+import profiling
+from calculators import COULOMB_CONSTANT, MU_0
+
+MAX_POINTS = 10 ** 7
+CHART_POINTS = 1000
+
+
+def _magnetic_field(current, distance):
+    return (MU_0 * current) / (2 * 3.141592653589793 * distance)
+
+
+def _electric_field(charge, distance):
+    return COULOMB_CONSTANT * charge / (distance ** 2)
+
+
+def _electric_force(charge1, charge2, distance):
+    return COULOMB_CONSTANT * abs(charge1 * charge2) / (distance ** 2)
+
+
+# Calculator name (as in cli.CALCULATORS) -> (vectorized formula, fixed argument names)
+SWEEPS = {
+    "magnetic_field": (_magnetic_field, ("current",)),
+    "electric_field": (_electric_field, ("charge",)),
+    "electric_force": (_electric_force, ("charge1", "charge2")),
+}
+
+
+def sweep_range(start, stop, points, scale="linear"):
+    """Returns `points` distances from start to stop, evenly spaced on a linear or log scale."""
+    points = int(points)
+    if not 2 <= points <= MAX_POINTS:
+        raise ValueError(f"Points must be between 2 and {MAX_POINTS}")
+    if scale == "log":
+        if start <= 0 or stop <= 0:
+            raise ValueError("A log sweep needs positive limits")
+        return np.geomspace(start, stop, points)
+    if scale != "linear":
+        raise ValueError("Scale must be 'linear' or 'log'")
+    return np.linspace(start, stop, points)
+
+
+@profiling.compute("sweep")
+def sweep(calculator, arguments, start, stop, points, scale="linear"):
+    """Returns (distances, results) for one calculator with the other arguments held fixed."""
+    formula, names = SWEEPS[calculator]
+    distances = sweep_range(start, stop, points, scale)
+    valid = distances > 0
+    results = np.full(distances.size, np.nan)
+    results[valid] = formula(*(float(arguments[name]) for name in names), distances[valid])
+    return distances, results
+
+
+def min_max(x, y, buckets):
+    """Keeps the smallest and largest y of each of about `buckets` equal-count buckets, in x order."""
+    if x.size <= 2 * buckets:
+        return x, y
+    size = x.size // buckets
+    full = size * buckets
+    blocks = y[:full].reshape(buckets, size)
+    starts = np.arange(0, full, size)
+    keep = [starts + blocks.argmin(axis=1), starts + blocks.argmax(axis=1)]
+    if full < x.size:
+        # The leftover tail is one more, shorter bucket
+        keep.append(full + np.array([y[full:].argmin(), y[full:].argmax()]))
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+
+def lttb(x, y, threshold):
+    """Largest triangle three buckets: keeps `threshold` points that preserve the curve's shape."""
+    if x.size <= threshold or threshold < 3:
+        return x, y
+    edges = np.linspace(1, x.size - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, x.size - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        # The next bucket's mean stands in for the point not chosen yet
+        next_stop = edges[i + 2] if i + 2 < edges.size else x.size
+        mean_x = x[stop:next_stop].mean()
+        mean_y = y[stop:next_stop].mean()
+        areas = np.abs((x[previous] - mean_x) * (y[start:stop] - y[previous])
+                       - (x[previous] - x[start:stop]) * (mean_y - y[previous]))
+        previous = selected[i + 1] = start + int(np.argmax(areas))
+    return x[selected], y[selected]
+
+
+@profiling.compute("downsample")
+def downsample(x, y, points=CHART_POINTS, method="lttb"):
+    """Drops NaN results and reduces the curve to at most `points` points."""
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if method == "lttb":
+        # LTTB visits every bucket in Python, so very dense curves are first cut down with min/max
+        if x.size > 100 * points:
+            x, y = min_max(x, y, 50 * points)
+        return lttb(x, y, points)
+    if method == "minmax":
+        # Two points per bucket, plus two for a leftover tail
+        return min_max(x, y, (points - 2) // 2)
+    raise ValueError("Method must be 'lttb' or 'minmax'")
@@ -0,0 +1,22 @@
+import pytest
+
+from eseries import network_value, search
+
+
+@pytest.mark.parametrize("target, kind, series", [(3300, "resistance", "E24"), (1e12, "capacitance", "E12"),
+                                                   (1e-20, "capacitance", "E12"), (1e-5, "resistance", "E96")])
+def test_every_part_count_has_an_entry(target, kind, series):
+    matches = search(target, kind, series, 4)
+    assert [m["parts"] for m in matches] == [1, 2, 3, 4]
+    for m in matches:
+        assert m["value"] == network_value(m["network"], kind)
+        assert m["error"] == pytest.approx(abs(m["value"] - target) / target)
+
+
+def test_exact_standard_value():
+    assert search(4700, "resistance", "E12", 1)[0]["error"] == 0.0
+
+
+@pytest.mark.parametrize("target", [0, -100, float("inf"), float("nan")])
+def test_rejects_targets_that_are_not_positive_and_finite(target):
+    assert search(target, "resistance", "E12", 4) == "Error: Target must be positive and finite."
@@ -0,0 +1,27 @@
+import numpy as np
+
+from calculators import calculate_magnetic_field
+from magnetic_field import magnetic_field
+
+
+def test_long_straight_wire_matches_calculate_magnetic_field():
+    wire = np.array([[0.0, 0.0, -1e5], [0.0, 0.0, 1e5]])
+    distances = np.array([0.01, 0.1, 0.5, 1.0, 3.0])
+    angles = np.linspace(0, 2 * np.pi, len(distances), endpoint=False)
+    points = np.column_stack((distances * np.cos(angles), distances * np.sin(angles), np.zeros(len(distances))))
+
+    bx, by, bz = magnetic_field([wire], [2.5], points)
+
+    expected = [calculate_magnetic_field(2.5, r) for r in distances]
+    np.testing.assert_allclose(np.hypot(bx, by), expected, rtol=1e-8)
+    np.testing.assert_allclose(bz, 0.0, atol=1e-20)
+    # Current along +z circulates counterclockwise seen from above: B is along z × r
+    np.testing.assert_allclose(bx * points[:, 1] - by * points[:, 0], -np.hypot(bx, by) * distances, rtol=1e-8)
+
+
+def test_processes_give_the_same_field():
+    loop = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    points = np.random.default_rng(0).uniform(-3, 3, (2000, 3))
+    serial = magnetic_field([loop], [1.0], points, closed=True, max_chunk_bytes=4096)
+    parallel = magnetic_field([loop], [1.0], points, closed=True, max_chunk_bytes=4096, processes=2)
+    np.testing.assert_array_equal(serial, parallel)
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from calculators import calculate_electric_force
+from nbody import coulomb_forces
+
+
+def test_barnes_hut_with_theta_zero_equals_exact():
+    rng = np.random.default_rng(0)
+    charges = rng.uniform(-1e-6, 1e-6, 3000)
+    positions = rng.uniform(0, 1, (3000, 3))
+
+    exact = np.column_stack(coulomb_forces(charges, positions, mode="exact"))
+    approximate = np.column_stack(coulomb_forces(charges, positions, mode="barnes-hut", theta=0.0))
+
+    np.testing.assert_allclose(approximate, exact, rtol=1e-9, atol=1e-12 * np.abs(exact).max())
+
+
+def test_pair_matches_calculate_electric_force():
+    fx, fy, fz = coulomb_forces([2e-6, -3e-6], [[0.0, 0.0], [0.3, 0.4]])
+    expected = calculate_electric_force(2e-6, -3e-6, 0.5)
+    assert np.hypot(fx[0], fy[0]) == pytest.approx(expected)
+    # Opposite charges attract, and the forces are equal and opposite
+    assert fx[0] > 0 and fy[0] > 0
+    np.testing.assert_allclose([fx[1], fy[1], fz[1]], [-fx[0], -fy[0], -fz[0]])
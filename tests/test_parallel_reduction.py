@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import parallel_reduction
+from calculators import calculate_resistance
+from parallel_reduction import SharedValues, calculate_resistance_parallel, reproducible_sum
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Small blocks and threshold, so a short array still takes the multi-process path
+    monkeypatch.setattr(parallel_reduction, "MIN_PARALLEL_SIZE", 1000)
+    return 997
+
+
+def test_sum_is_bitwise_identical_across_worker_counts(small_blocks):
+    values = np.random.default_rng(0).lognormal(0, 3, 200_000)
+    totals = {reproducible_sum(values, reciprocal, workers, small_blocks)
+              for reciprocal in (False,) for workers in (1, 2, 3)}
+    reciprocal_totals = {reproducible_sum(values, True, workers, small_blocks) for workers in (1, 2, 3)}
+    assert len(totals) == 1
+    assert len(reciprocal_totals) == 1
+
+
+def test_shared_values_give_the_same_total(small_blocks):
+    values = np.random.default_rng(1).uniform(1, 1000, 50_000)
+    with SharedValues(values) as shared:
+        assert reproducible_sum(shared, True, 2, small_blocks) == reproducible_sum(values, True, 1, small_blocks)
+
+
+def test_matches_scalar_calculate_resistance():
+    values = np.random.default_rng(2).uniform(1, 1000, 10_000)
+    for configuration in ("Series", "Parallel"):
+        expected = calculate_resistance(values.tolist(), configuration)
+        assert calculate_resistance_parallel(values, configuration) == pytest.approx(expected, rel=1e-12)
+    assert calculate_resistance_parallel(values, "Diagonal") == calculate_resistance(values.tolist(), "Diagonal")
+    assert calculate_resistance_parallel([], "Series") == calculate_resistance([], "Series")
+
+
+@pytest.mark.parametrize("configuration", ["Series", "Parallel", "Diagonal"])
+def test_nan_does_not_hide_a_negative_value(small_blocks, configuration):
+    values = np.random.default_rng(3).uniform(1, 1000, 5000)
+    values[10] = np.nan
+    values[20] = -5.0
+    expected = calculate_resistance(values.tolist(), configuration)
+    assert expected == "Error: All resistance values must be positive."
+    assert calculate_resistance_parallel([np.nan, -5.0, 10.0], configuration) == expected
+    for workers in (1, 2):
+        assert calculate_resistance_parallel(values, configuration, workers) == expected
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from resistor_network import ResistorNetwork
+
+
+def grid_edges(size, rng):
+    edges = []
+    for row in range(size):
+        for column in range(size):
+            node = row * size + column
+            if column + 1 < size:
+                edges.append((node, node + 1, rng.uniform(1, 100)))
+            if row + 1 < size:
+                edges.append((node, node + size, rng.uniform(1, 100)))
+    return edges
+
+
+def test_woodbury_update_matches_fresh_factorization():
+    rng = np.random.default_rng(0)
+    edges = grid_edges(12, rng)
+    network = ResistorNetwork(edges, refactor_after=32)
+    changes = {int(i): rng.uniform(1, 100) for i in rng.choice(len(edges), 10, replace=False)}
+
+    network.update_resistances(changes)
+    assert network._correction is not None  # Still the low-rank path, not a refactorization
+
+    updated = [(a, b, changes.get(i, r)) for i, (a, b, r) in enumerate(edges)]
+    fresh = ResistorNetwork(updated)
+    for a, b in ((0, 143), (5, 77), (12, 13)):
+        assert network.equivalent_resistance(a, b) == pytest.approx(fresh.equivalent_resistance(a, b), rel=1e-10)
+    voltages, currents = network.solve(0, 143, voltage=5.0)
+    fresh_voltages, fresh_currents = fresh.solve(0, 143, voltage=5.0)
+    np.testing.assert_allclose(voltages, fresh_voltages, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(currents, fresh_currents, rtol=1e-10, atol=1e-12)
+
+
+def test_series_and_parallel():
+    network = ResistorNetwork([("a", "b", 100.0), ("b", "c", 220.0), ("a", "c", 470.0)])
+    assert network.equivalent_resistance("a", "c") == pytest.approx(1 / (1 / 320 + 1 / 470))
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from service import CalculationService
+
+
+async def request(port, method, path, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                 + body)
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b" ", 2)[1])
+    return status, json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+def test_unknown_paths_share_one_stats_entry():
+    async def run():
+        service = CalculationService()
+        server = await asyncio.start_server(service.serve_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            assert (await request(port, "GET", "/whatever"))[0] == 405
+            assert (await request(port, "POST", "/other", b"not json"))[0] == 400
+            assert (await request(port, "POST", "/calculate/nothing", b"{}"))[0] == 404
+            status, payload = await request(port, "POST", "/calculate/resistance",
+                                            b'{"values": [10, 20], "configuration": "Series"}')
+            assert status == 200
+            return (await request(port, "GET", "/stats"))[1]["endpoints"]
+
+    endpoints = asyncio.run(run())
+    assert endpoints["unknown"]["requests"] == 3
+    assert endpoints["/calculate/resistance"]["requests"] == 1
+    assert not {"/whatever", "/other", "/calculate/nothing"} & set(endpoints)
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from value_parser import parse_values
+
+
+def test_prefixes_and_units():
+    np.testing.assert_allclose(parse_values("4.7k, 10k\n100n 2.2uF 1MΩ 3µ"), [4.7e3, 1e4, 1e-7, 2.2e-6, 1e6, 3e-6])
+
+
+@pytest.mark.parametrize("text", ["inf", "10k inf", "10k, -Infinity", "10k, nan", "NaN 1u"])
+def test_special_values_parse_alike_with_and_without_suffixes(text):
+    expected = [float(token) for token in text.replace(",", " ").replace("k", "e3").replace("u", "e-6").split()]
+    np.testing.assert_array_equal(parse_values(text), expected)
+
+
+@pytest.mark.parametrize("text", ["10k x", "4Ωk", "k", "10k F"])
+def test_invalid_values_raise(text):
+    with pytest.raises(ValueError):
+        parse_values(text)
@@ -0,0 +1,194 @@
+"""Monte Carlo tolerance analysis of series/parallel capacitor and resistor networks.
+
+Each trial draws every part from its own distribution around the nominal
+value and computes the network total. Trials run in vectorized batches and
+feed a StreamingStats, which keeps running moments and a fixed-bin histogram
+of the total, so memory does not grow with the number of trials.
+
+    stats = analyze_resistance_tolerance([100, 220, 470], "Parallel", 0.05, trials=10 ** 7, workers=4)
+    stats.percentile(95)
+
+Trials are split into fixed tasks, each with its own seed derived from
+`seed`, so a given seed gives the same result for any number of workers.
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import profiling
+
+DISTRIBUTIONS = ("uniform", "normal")
+# A tolerance is the half-width of a uniform distribution and 3 sigma of a normal one;
+# the histogram spans this many tolerances either side of the nominal part values.
+HISTOGRAM_SPAN = {"uniform": 1.0, "normal": 2.0}
+HISTOGRAM_BINS = 4096
+TASK_TRIALS = 2 ** 20
+BATCH_BYTES = 32 * 1024 * 1024
+PERCENTILES = (1, 5, 50, 95, 99)
+
+
+class StreamingStats:
+    """Count, mean, variance, extremes and a fixed-bin histogram of a stream of samples."""
+
+    def __init__(self, low, high, bins=HISTOGRAM_BINS):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.below = 0
+        self.above = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, samples):
+        samples = np.asarray(samples, dtype=np.float64).ravel()
+        if not samples.size:
+            return
+        batch = StreamingStats(self.edges[0], self.edges[-1], self.counts.size)
+        batch.count = samples.size
+        batch.mean = float(samples.mean())
+        batch.m2 = float(np.square(samples - batch.mean).sum())
+        batch.min = float(samples.min())
+        batch.max = float(samples.max())
+        low, high = self.edges[0], self.edges[-1]
+        scale = self.counts.size / (high - low) if high > low else 0.0
+        index = np.floor((samples - low) * scale).astype(np.int64)
+        # A sample exactly on the upper edge belongs to the last bin
+        index[samples == high] = self.counts.size - 1
+        batch.below = int((index < 0).sum())
+        batch.above = int((index >= self.counts.size).sum())
+        inside = index[(index >= 0) & (index < self.counts.size)]
+        batch.counts = np.bincount(inside, minlength=self.counts.size)
+        self.merge(batch)
+
+    def merge(self, other):
+        """Adds another StreamingStats with the same bins (Chan et al. parallel variance)."""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.counts += other.counts
+        self.below += other.below
+        self.above += other.above
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, q):
+        """Returns the q-th percentile, interpolated within a histogram bin."""
+        if not self.count:
+            return math.nan
+        rank = q / 100 * self.count
+        if rank <= self.below:
+            return self.min
+        cumulative = self.below + np.cumsum(self.counts)
+        position = int(np.searchsorted(cumulative, rank))
+        if position >= self.counts.size:
+            return self.max
+        before = cumulative[position] - self.counts[position]
+        fraction = (rank - before) / self.counts[position]
+        value = self.edges[position] + fraction * (self.edges[position + 1] - self.edges[position])
+        return float(min(max(value, self.min), self.max))
+
+    def histogram(self, bins=None):
+        """Returns (counts, edges), merged down to `bins` bins if given."""
+        if bins is None or bins >= self.counts.size:
+            return self.counts.copy(), self.edges.copy()
+        group = -(-self.counts.size // bins)
+        starts = np.arange(0, self.counts.size, group)
+        return np.add.reduceat(self.counts, starts), np.append(self.edges[starts], self.edges[-1])
+
+    def as_dict(self, histogram_bins=64):
+        counts, edges = self.histogram(histogram_bins)
+        return {
+            "trials": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "percentiles": {q: self.percentile(q) for q in PERCENTILES},
+            "histogram": {"counts": counts.tolist(), "edges": edges.tolist(),
+                          "below": self.below, "above": self.above},
+        }
+
+
+def network_totals(samples, reciprocal):
+    """Totals for a (trials, parts) array: sum of values, or inverse sum of reciprocals."""
+    if reciprocal:
+        return 1.0 / np.reciprocal(samples).sum(axis=1)
+    return samples.sum(axis=1)
+
+
+def _run_task(values, tolerances, distribution, reciprocal, trials, seed, low, high, bins):
+    """Runs `trials` trials in memory-bounded batches; executed in worker processes."""
+    rng = np.random.default_rng(seed)
+    stats = StreamingStats(low, high, bins)
+    batch = max(1, BATCH_BYTES // (8 * values.size))
+    for start in range(0, trials, batch):
+        size = min(batch, trials - start)
+        if distribution == "uniform":
+            factors = rng.uniform(-1.0, 1.0, (size, values.size))
+        else:
+            factors = rng.standard_normal((size, values.size)) / 3.0
+        factors *= tolerances
+        factors += 1.0
+        factors *= values
+        stats.update(network_totals(factors, reciprocal))
+    return stats
+
+
+def _analyze(values, configuration, tolerances, trials, distribution, workers, seed, reciprocal_configuration, name):
+    values = np.asarray(values, dtype=np.float64).ravel()
+    if not values.size:
+        return f"Error: At least one {name} value is required."
+    if np.any(values <= 0):
+        return f"Error: All {name} values must be positive."
+    if configuration not in ("Series", "Parallel"):
+        return "Error: Configuration must be 'Series' or 'Parallel'."
+    tolerances = np.broadcast_to(np.asarray(tolerances, dtype=np.float64), values.shape)
+    if np.any(tolerances < 0) or np.any(tolerances >= 1):
+        return "Error: Tolerances must be between 0 and 1 (e.g. 0.05 for ±5%)."
+    if distribution not in DISTRIBUTIONS:
+        return "Error: Distribution must be 'uniform' or 'normal'."
+
+    reciprocal = configuration == reciprocal_configuration
+    span = HISTOGRAM_SPAN[distribution] * tolerances
+    # Totals grow with every part, so the extreme parts give the histogram range
+    low = float(network_totals(values * np.maximum(1 - span, 1e-12)[None, :], reciprocal)[0])
+    high = float(network_totals(values * (1 + span)[None, :], reciprocal)[0])
+    seeds = np.random.SeedSequence(seed).spawn(-(-trials // TASK_TRIALS))
+    tasks = [(values, tolerances, distribution, reciprocal, min(TASK_TRIALS, trials - i * TASK_TRIALS),
+              task_seed, low, high, HISTOGRAM_BINS) for i, task_seed in enumerate(seeds)]
+
+    stats = StreamingStats(low, high)
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() returns in task order, so the merge order never depends on timing
+            for task_stats in pool.map(_run_task, *zip(*tasks)):
+                stats.merge(task_stats)
+    else:
+        for task in tasks:
+            stats.merge(_run_task(*task))
+    return stats
+
+
+@profiling.compute("analyze_capacitance_tolerance")
+def analyze_capacitance_tolerance(values, configuration, tolerances, trials=10 ** 6, distribution="uniform",
+                                  workers=None, seed=0):
+    """Samples total capacitance with each part within its tolerance; returns a StreamingStats."""
+    return _analyze(values, configuration, tolerances, trials, distribution, workers, seed, "Series", "capacitance")
+
+
+@profiling.compute("analyze_resistance_tolerance")
+def analyze_resistance_tolerance(values, configuration, tolerances, trials=10 ** 6, distribution="uniform",
+                                 workers=None, seed=0):
+    """Samples total resistance with each part within its tolerance; returns a StreamingStats."""
+    return _analyze(values, configuration, tolerances, trials, distribution, workers, seed, "Parallel", "resistance")
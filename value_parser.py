@@ -0,0 +1,100 @@
+"""Bulk parsing of component value lists, with SI prefixes, into NumPy arrays.
+
+Values may be separated by commas, semicolons, spaces or newlines and may end
+in an SI prefix, optionally followed by an F or Ω unit:
+
+    parse_values("4.7k, 10k\\n100n 2.2uF 1MΩ")
+
+Plain numeric lists are converted in one NumPy call; lists with suffixes are
+scaled with array operations rather than per-value Python code. load_values()
+reads a list from a text or .npy file, memory-mapping it so very large files
+are not read into memory as a whole.
+"""
+import mmap
+import os
+
+import numpy as np
+
+SI_PREFIXES = {
+    "f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "m": 1e-3,
+    "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12,
+}
+# Non-ASCII spellings, rewritten before parsing. The ohm signs become NUL bytes,
+# which NumPy drops from the end of a bytes value, so they act as a unit suffix.
+ALIASES = {"µ": "u", "μ": "u", "Ω": "\0", "\u2126": "\0"}
+SEPARATOR_BYTES = (b",", b";", b" ", b"\n", b"\t", b"\r")
+TEXT_CHUNK_BYTES = 16 * 2 ** 20
+
+_ALIASES = [(alias.encode(), ascii.encode()) for alias, ascii in ALIASES.items()]
+# Tokens float() reads as they are; stripping a prefix would read the f of inf as femto
+_SPECIAL_VALUES = [sign + word for sign in (b"", b"+", b"-") for word in (b"inf", b"infinity", b"nan")]
+_PREFIX_CODES = np.frombuffer("".join(SI_PREFIXES).encode(), dtype=np.uint8)
+# Scale by character code; code 0 (no prefix) scales by 1
+_SCALES = np.ones(256)
+_SCALES[_PREFIX_CODES] = list(SI_PREFIXES.values())
+
+
+def _strip_last(tokens, lengths, codes):
+    """Removes the last character of every token that ends in one of codes; returns the removed characters."""
+    rows = np.arange(len(tokens))
+    characters = tokens.view(np.uint8).reshape(len(tokens), -1)
+    last = characters[rows, lengths - 1]
+    found = np.isin(last, codes)
+    characters[rows[found], lengths[found] - 1] = 0
+    lengths[found] -= 1
+    return np.where(found, last, 0)
+
+
+def _parse_suffixed(text):
+    data = text.encode("utf-8")
+    for alias, ascii in _ALIASES:
+        data = data.replace(alias, ascii)
+    tokens = np.array(data.replace(b",", b" ").replace(b";", b" ").split())
+    if tokens.size == 0:
+        return np.empty(0)
+    lengths = np.strings.str_len(tokens)
+    characters = tokens.view(np.uint8).reshape(len(tokens), -1)
+    if ((characters == 0) & (np.arange(characters.shape[1]) < lengths[:, None])).any():
+        raise ValueError("Ohm sign before the end of a value")
+    special = np.isin(np.strings.lower(tokens), _SPECIAL_VALUES)
+    values = np.empty(len(tokens))
+    values[special] = tokens[special].astype(np.float64)
+    tokens, lengths = tokens[~special], lengths[~special]
+    _strip_last(tokens, lengths, np.frombuffer(b"F", dtype=np.uint8))
+    if (lengths == 0).any():
+        raise ValueError("Value without a number")
+    prefixes = _strip_last(tokens, lengths, _PREFIX_CODES)
+    values[~special] = tokens.astype(np.float64) * _SCALES[prefixes]
+    return values
+
+
+def parse_values(text):
+    """Returns a float64 array of the values in text, raising ValueError on anything unparseable."""
+    try:
+        return np.array(text.replace(",", " ").replace(";", " ").split(), dtype=np.float64)
+    except ValueError:
+        return _parse_suffixed(text)
+
+
+def load_values(path, chunk_bytes=TEXT_CHUNK_BYTES):
+    """Returns the values in a text file, or a read-only memory map of the array in a .npy file."""
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return np.load(path, mmap_mode="r").reshape(-1)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return np.empty(0)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            parts = []
+            start = 0
+            while start < len(data):
+                end = min(start + chunk_bytes, len(data))
+                if end < len(data):
+                    # Cut after a separator so no value (or UTF-8 character) is split
+                    cut = max(data.rfind(separator, start, end) for separator in SEPARATOR_BYTES)
+                    if cut < start:
+                        cut = min((i for i in (data.find(separator, end) for separator in SEPARATOR_BYTES) if i >= 0),
+                                  default=len(data) - 1)
+                    end = cut + 1
+                parts.append(parse_values(data[start:end].decode("utf-8")))
+                start = end
+    return np.concatenate(parts)